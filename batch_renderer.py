@@ -0,0 +1,144 @@
+"""
+Batched cube rendering: the whole stack is gathered into contiguous per-cube
+arrays, expanded into one vertex buffer with atlas UVs, and drawn with a
+single draw call.
+"""
+
+import numpy as np
+from OpenGL.GL import *
+import gl_state
+from vbo_renderer import build_unit_cube, begin_textured_arrays, CUBE_VERTEX_COUNT
+from graphics import atlas_v
+from cube_stack import Stack, TEXTURE_INDEX
+
+
+_unit_cube = build_unit_cube()
+_stream_buffer = None
+
+
+def collect_instances(stack, lo: int = 0, hi: int = None):
+    """
+    Gather per-cube attributes of stack[lo:hi] into contiguous arrays.
+    An array-backed Stack hands out views of its own arrays instead.
+
+    Parameters:
+        stack (List[Cube] | Stack): Cubes to gather, bottom to top.
+        lo (int): First index to gather.
+        hi (int): End of the range (exclusive); len(stack) when None.
+
+    Returns:
+        tuple: (positions, sizes, rotations, texture_ids) where the first three
+            are (N, 3) float32 arrays and texture_ids is an (N,) uint8 array of
+            indices into TEXTURE_NAMES.
+    """
+    hi = len(stack) if hi is None else hi
+    if isinstance(stack, Stack):
+        return stack.arrays(lo, hi)
+
+    n = hi - lo
+    positions = np.empty((n, 3), dtype=np.float32)
+    sizes = np.empty((n, 3), dtype=np.float32)
+    rotations = np.empty((n, 3), dtype=np.float32)
+    texture_ids = np.empty(n, dtype=np.uint8)
+    for i in range(n):
+        cube = stack[lo + i]
+        positions[i] = cube.position
+        sizes[i] = cube.size
+        rotations[i] = cube.rotation
+        texture_ids[i] = TEXTURE_INDEX[cube.texture_id]
+    return positions, sizes, rotations, texture_ids
+
+
+def rotation_matrices(rotations: np.ndarray) -> np.ndarray:
+    """
+    Build per-cube rotation matrices matching glRotatef x, then y, then z.
+
+    Parameters:
+        rotations (np.ndarray): (N, 3) rotation angles in degrees.
+
+    Returns:
+        np.ndarray: (N, 3, 3) matrices M = Rx @ Ry @ Rz.
+    """
+    rx, ry, rz = np.radians(rotations.astype(np.float64)).T
+    cx, sx = np.cos(rx), np.sin(rx)
+    cy, sy = np.cos(ry), np.sin(ry)
+    cz, sz = np.cos(rz), np.sin(rz)
+    m = np.empty((len(rotations), 3, 3))
+    m[:, 0, 0] = cy * cz
+    m[:, 0, 1] = -cy * sz
+    m[:, 0, 2] = sy
+    m[:, 1, 0] = sx * sy * cz + cx * sz
+    m[:, 1, 1] = -sx * sy * sz + cx * cz
+    m[:, 1, 2] = -sx * cy
+    m[:, 2, 0] = -cx * sy * cz + sx * sz
+    m[:, 2, 1] = cx * sy * sz + sx * cz
+    m[:, 2, 2] = cx * cy
+    return m
+
+
+def expand_instances(positions: np.ndarray, sizes: np.ndarray,
+                     rotations: np.ndarray, texture_ids: np.ndarray) -> np.ndarray:
+    """
+    Transform the unit cube by every instance into one interleaved array,
+    with each instance's v coordinates mapped into its atlas tile.
+
+    Parameters:
+        positions (np.ndarray): (N, 3) cube origins.
+        sizes (np.ndarray): (N, 3) cube dimensions.
+        rotations (np.ndarray): (N, 3) rotation angles in degrees.
+        texture_ids (np.ndarray): (N,) indices into TEXTURE_NAMES.
+
+    Returns:
+        np.ndarray: (N * 24, 5) float32 array of [u, v, x, y, z] rows.
+    """
+    n = len(positions)
+    out = np.empty((n, CUBE_VERTEX_COUNT, 5), dtype=np.float32)
+    out[:, :, 0] = _unit_cube[:, 0]
+    out[:, :, 1] = atlas_v(_unit_cube[:, 1], texture_ids[:, None])
+    corners = _unit_cube[:, 2:] * sizes[:, None, :]
+    if rotations.any():
+        corners = np.einsum("nij,nvj->nvi", rotation_matrices(rotations), corners)
+    out[:, :, 2:] = corners + positions[:, None, :]
+    return out.reshape(n * CUBE_VERTEX_COUNT, 5)
+
+
+def draw_stack(stack, window=None) -> None:
+    """
+    Draw the stack as one streamed vertex buffer, one bind and one draw call.
+
+    Parameters:
+        stack (List[Cube]): Cubes to draw, bottom to top.
+        window (Optional[Tuple[int, int]]): Half-open index range to draw;
+            the whole stack when None.
+    """
+    global _stream_buffer
+    lo, hi = window if window is not None else (0, len(stack))
+    if lo >= hi:
+        return
+    if _stream_buffer is None:
+        _stream_buffer = glGenBuffers(1)
+
+    vertices = expand_instances(*collect_instances(stack, lo, hi))
+
+    begin_textured_arrays(_stream_buffer)
+    glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STREAM_DRAW)
+    glDrawArrays(GL_QUADS, 0, len(vertices))
+
+
+def reset_stream_buffer() -> None:
+    """
+    Forget the streaming buffer; call when a new GL context is created. A
+    buffer still live in the current context (it was kept) is deleted.
+    """
+    global _stream_buffer
+    if _stream_buffer is not None and glIsBuffer(_stream_buffer):
+        gl_state.delete_buffers([_stream_buffer])
+    _stream_buffer = None
+
+
+def release_stream_buffer() -> None:
+    """Delete the streaming buffer; call before the GL context is torn down."""
+    global _stream_buffer
+    if _stream_buffer is not None:
+        gl_state.delete_buffers([_stream_buffer])
+    _stream_buffer = None
@@ -0,0 +1,317 @@
+"""
+Batched headless simulation: many independent games advanced in lockstep
+with NumPy, for tuning difficulty over large populations of games.
+
+Per-tick motion, bouncing and drop trimming run as array operations over
+every game at once. Events that draw random numbers (spawns, random
+acceleration, teleports) are rare and go through the scalar game_logic and
+cube_special functions on the game's own random.Random, so a game played
+here with the default settings is bit-for-bit the same game a Simulation
+with the same seed plays under the same drops (see play_scalar).
+"""
+
+import argparse
+import random
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+from models import Cube
+from cube_stack import TEXTURE_NAMES, TEXTURE_INDEX
+from cube_special import apply_random_acceleration, teleport_forward
+from game_logic import spawn_next_cube, intersect_rect_array
+from simulation import Simulation
+from config import (
+    INITIAL_CUBE_POS, INITIAL_CUBE_SIZE, SPAWN_RADIUS, ARRIVAL_FRAMES,
+    SPECIAL_INTERVAL_TICKS, ACCELERATION_RANGE
+)
+
+
+REACTION_TICKS = (90, 110)     # default player model: ticks between drops
+MAX_SCORE = 1000               # games reaching this score are stopped
+
+VAR_A = TEXTURE_INDEX["var_a"]
+VAR_POS = TEXTURE_INDEX["var_pos"]
+
+
+def policy_rng(seed: int) -> random.Random:
+    """Random source of the simulated player, independent of the game's."""
+    return random.Random(f"policy-{seed}")
+
+
+def play_scalar(seed: int, reaction_ticks: Tuple[int, int] = REACTION_TICKS,
+                max_score: int = MAX_SCORE) -> Tuple[int, int]:
+    """
+    Play one game with Simulation under the batch player model, as the
+    reference BatchSimulation must reproduce.
+
+    Returns:
+        Tuple[int, int]: (score, ticks played).
+    """
+    sim = Simulation(seed)
+    player = policy_rng(seed)
+    while not sim.lost and sim.score < max_score:
+        sim.run(player.randint(*reaction_ticks))
+        sim.drop()
+    return sim.score, sim.tick_count
+
+
+class BatchSimulation:
+    """
+    N games of cube stacking advanced one tick at a time, all together.
+
+    Each game is driven by a simple player model: it drops the moving cube
+    after a number of ticks drawn uniformly from reaction_ticks, then waits
+    again, until a drop misses or max_score is reached.
+
+    Attributes:
+        seeds (List[int]): Seed of each game.
+        running (int): Number of games still being played.
+        scores (np.ndarray): Score of each game so far.
+        ticks (np.ndarray): Ticks each game has run; final once it is over.
+        lost (np.ndarray): True for games that ended on a missed drop.
+        tick_count (int): Ticks simulated so far (shared by all games).
+    """
+
+    def __init__(self, seeds: Sequence[int],
+                 reaction_ticks: Tuple[int, int] = REACTION_TICKS,
+                 max_score: int = MAX_SCORE,
+                 spawn_radius: float = SPAWN_RADIUS,
+                 arrival_frames: float = ARRIVAL_FRAMES,
+                 texture_pool: Optional[List[str]] = None,
+                 special_interval: int = SPECIAL_INTERVAL_TICKS,
+                 acceleration_range: Tuple[float, float] = ACCELERATION_RANGE):
+        self.seeds = list(seeds)
+        self.reaction_ticks = reaction_ticks
+        self.max_score = max_score
+        self.spawn_radius = spawn_radius
+        self.arrival_frames = arrival_frames
+        self.texture_pool = texture_pool
+        self.special_interval = special_interval
+        self.acceleration_range = acceleration_range
+
+        n = len(self.seeds)
+        self.scores = np.zeros(n, dtype=np.int64)
+        self.ticks = np.zeros(n, dtype=np.int64)
+        self.lost = np.zeros(n, dtype=bool)
+        self.tick_count = 0
+
+        # One row per game still in the arrays; finished games are parked
+        # (no motion, no events) and their rows compacted away in bulk
+        self.game = np.arange(n)
+        self.parked = np.zeros(n, dtype=bool)
+        self.running = n
+        self.rngs = [random.Random(seed) for seed in self.seeds]
+        self.players = [policy_rng(seed) for seed in self.seeds]
+        self.position = np.zeros((n, 3))
+        self.size = np.zeros((n, 3))
+        self.direction = np.zeros((n, 3))
+        self.spawn = np.zeros((n, 3))
+        self.target = np.zeros((n, 3))
+        self.base_position = np.tile(np.array(INITIAL_CUBE_POS, dtype=float), (n, 1))
+        self.base_size = np.tile(np.array(INITIAL_CUBE_SIZE, dtype=float), (n, 1))
+        self.travel_distance = np.zeros(n)
+        self.traveled = np.zeros(n)
+        self.step_distance = np.zeros(n)
+        self.moving_state = np.ones(n, dtype=np.int8)
+        self.texture = np.zeros(n, dtype=np.int8)
+        self.next_drop = np.zeros(n, dtype=np.int64)
+
+        self._spawn(self.game)
+        self.next_drop[:] = [player.randint(*reaction_ticks) for player in self.players]
+
+    def _cubes(self, rows: np.ndarray) -> List[Cube]:
+        """Scalar Cubes holding the moving cubes of the given rows."""
+        return [
+            Cube(position=position, rotation=[0.0, 0.0, 0.0], size=size,
+                 direction=direction, moving_state=moving_state, spawn=spawn,
+                 target=target, travel_distance=travel_distance,
+                 traveled=traveled, texture_id=TEXTURE_NAMES[texture])
+            for position, size, direction, moving_state, spawn, target,
+                travel_distance, traveled, texture in zip(
+                    self.position[rows].tolist(), self.size[rows].tolist(),
+                    self.direction[rows].tolist(), self.moving_state[rows].tolist(),
+                    self.spawn[rows].tolist(), self.target[rows].tolist(),
+                    self.travel_distance[rows].tolist(), self.traveled[rows].tolist(),
+                    self.texture[rows].tolist())
+        ]
+
+    def _store(self, rows: np.ndarray, cubes: List[Cube]) -> None:
+        """Write scalar Cubes back into the given rows."""
+        if not cubes:
+            return
+        self.position[rows] = [cube.position for cube in cubes]
+        self.size[rows] = [cube.size for cube in cubes]
+        self.direction[rows] = [cube.direction for cube in cubes]
+        self.spawn[rows] = [cube.spawn for cube in cubes]
+        self.target[rows] = [cube.target for cube in cubes]
+        self.travel_distance[rows] = [cube.travel_distance for cube in cubes]
+        self.traveled[rows] = [cube.traveled for cube in cubes]
+        self.step_distance[rows] = [cube.step_distance() for cube in cubes]
+        self.moving_state[rows] = [cube.moving_state for cube in cubes]
+        self.texture[rows] = [TEXTURE_INDEX[cube.texture_id] for cube in cubes]
+
+    def _spawn(self, rows: np.ndarray) -> None:
+        """Spawn the next moving cube of each given game over its base cube."""
+        spawned = []
+        for row, position, size in zip(rows, self.base_position[rows].tolist(),
+                                       self.base_size[rows].tolist()):
+            stack = [Cube(position=position, rotation=[0.0, 0.0, 0.0], size=size)]
+            spawn_next_cube(stack, self.rngs[row], spawn_radius=self.spawn_radius,
+                            arrival_frames=self.arrival_frames,
+                            texture_pool=self.texture_pool)
+            spawned.append(stack[-1])
+        self._store(rows, spawned)
+
+    def _move(self) -> None:
+        """update_cube_motion for every running game."""
+        forward = self.moving_state == 1
+        sign = np.where(forward, 1.0, -1.0)
+        # x - d == x + (-d) exactly, so one signed add covers both directions
+        self.position += self.direction * sign[:, None]
+        self.traveled += self.step_distance * sign
+        turn_back = forward & (self.traveled >= 2 * self.travel_distance)
+        turn_forward = ~forward & (self.traveled <= 0)
+        self.moving_state[turn_back] = 2
+        self.moving_state[turn_forward] = 1
+
+    def _apply_specials(self) -> None:
+        """Random acceleration and teleports, as Simulation.step applies them."""
+        low, high = self.acceleration_range
+        rows = np.flatnonzero((self.texture == VAR_A) | (self.texture == VAR_POS))
+        cubes = self._cubes(rows)
+        for row, cube in zip(rows, cubes):
+            if cube.texture_id == "var_a":
+                apply_random_acceleration(cube, low, high, rng=self.rngs[row])
+            else:
+                teleport_forward(cube, self.rngs[row])
+        self._store(rows, cubes)
+
+    def _drop(self, rows: np.ndarray) -> np.ndarray:
+        """
+        Stop and trim the moving cube of the given games against their
+        base, as trim_or_lose does, and spawn the next cube for the hits.
+
+        Returns:
+            np.ndarray: Rows (of those given) whose drop missed.
+        """
+        base = np.column_stack((self.base_position[rows, 0], self.base_position[rows, 2],
+                                self.base_size[rows, 0], self.base_size[rows, 2]))
+        moving = np.column_stack((self.position[rows, 0], self.position[rows, 2],
+                                  self.size[rows, 0], self.size[rows, 2]))
+        overlaps, hit = intersect_rect_array(base, moving)
+
+        hits = rows[hit]
+        self.position[hits, 0] = overlaps[hit, 0]
+        self.position[hits, 2] = overlaps[hit, 1]
+        self.size[hits, 0] = overlaps[hit, 2]
+        self.size[hits, 2] = overlaps[hit, 3]
+        self.base_position[hits] = self.position[hits]
+        self.base_size[hits] = self.size[hits]
+        self.scores[self.game[hits]] += 1
+        self._spawn(hits)
+        return rows[~hit]
+
+    def _finish(self, rows: np.ndarray) -> None:
+        """Stop playing the given games, compacting once half the rows are parked."""
+        if not len(rows):
+            return
+        self.ticks[self.game[rows]] = self.tick_count
+        self.parked[rows] = True
+        self.direction[rows] = 0.0
+        self.step_distance[rows] = 0.0
+        self.texture[rows] = -1
+        self.next_drop[rows] = -1
+        self.running -= len(rows)
+        if self.running * 2 > len(self.game):
+            return
+        keep = np.flatnonzero(~self.parked)
+        for name in ("game", "parked", "position", "size", "direction", "spawn",
+                     "target", "base_position", "base_size", "travel_distance",
+                     "traveled", "step_distance", "moving_state", "texture",
+                     "next_drop"):
+            setattr(self, name, getattr(self, name)[keep])
+        self.rngs = [self.rngs[row] for row in keep]
+        self.players = [self.players[row] for row in keep]
+
+    def step(self) -> None:
+        """Advance every running game by one tick, then make due drops."""
+        self._move()
+        if self.tick_count % self.special_interval == 0:
+            self._apply_specials()
+        self.tick_count += 1
+
+        due = np.flatnonzero(self.next_drop == self.tick_count)
+        if not len(due):
+            return
+        missed = self._drop(due)
+        self.lost[self.game[missed]] = True
+        done = self.scores[self.game[due]] >= self.max_score
+        finished = np.union1d(missed, due[done])
+        for row in np.setdiff1d(due, finished):
+            self.next_drop[row] = self.tick_count + self.players[row].randint(*self.reaction_ticks)
+        self._finish(finished)
+
+    def run(self, max_ticks: Optional[int] = None) -> np.ndarray:
+        """
+        Play until every game is over (or max_ticks more ticks have run).
+
+        Returns:
+            np.ndarray: Score of each game.
+        """
+        end = None if max_ticks is None else self.tick_count + max_ticks
+        while self.running and (end is None or self.tick_count < end):
+            self.step()
+        self.ticks[self.game[~self.parked]] = self.tick_count
+        return self.scores
+
+
+def score_distribution(scores: np.ndarray) -> dict:
+    """
+    Summarise a population of final scores.
+
+    Returns:
+        dict: games, mean, std, min, max, percentiles (p10..p99) and
+            histogram (count of games per score, index = score).
+    """
+    scores = np.asarray(scores)
+    percentiles = (10, 25, 50, 75, 90, 99)
+    return {
+        "games": int(len(scores)),
+        "mean": float(scores.mean()),
+        "std": float(scores.std()),
+        "min": int(scores.min()),
+        "max": int(scores.max()),
+        "percentiles": {f"p{p}": float(v) for p, v in
+                        zip(percentiles, np.percentile(scores, percentiles))},
+        "histogram": np.bincount(scores).tolist(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Score distribution of many simulated games.")
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--reaction", type=int, nargs=2, default=REACTION_TICKS,
+                        metavar=("MIN", "MAX"), help="ticks between drops")
+    parser.add_argument("--max-score", type=int, default=MAX_SCORE)
+    parser.add_argument("--spawn-radius", type=float, default=SPAWN_RADIUS)
+    parser.add_argument("--arrival-frames", type=float, default=ARRIVAL_FRAMES)
+    parser.add_argument("--textures", nargs="+", default=None,
+                        help="texture pool to draw from; repeat names to weight them")
+    args = parser.parse_args()
+
+    batch = BatchSimulation(range(args.first_seed, args.first_seed + args.games),
+                            reaction_ticks=tuple(args.reaction), max_score=args.max_score,
+                            spawn_radius=args.spawn_radius,
+                            arrival_frames=args.arrival_frames,
+                            texture_pool=args.textures)
+    summary = score_distribution(batch.run())
+    histogram = summary.pop("histogram")
+    for key, value in summary.items():
+        print(f"{key:12} {value}")
+    for score, count in enumerate(histogram):
+        if count:
+            print(f"  {score:5d} {count:7d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Batched simulation benchmark: games/sec of BatchSimulation against the
+scalar Simulation playing the same games, and a check that every game's
+score and length match exactly.
+
+Usage:
+    python bench/bench_batch_sim.py [--games N] [--max-score S]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from batch_sim import BatchSimulation, play_scalar, score_distribution
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=2000)
+    parser.add_argument("--max-score", type=int, default=300)
+    args = parser.parse_args()
+    seeds = range(args.games)
+
+    start = time.perf_counter()
+    scalar = [play_scalar(seed, max_score=args.max_score) for seed in seeds]
+    scalar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = BatchSimulation(seeds, max_score=args.max_score)
+    batch.run()
+    batch_time = time.perf_counter() - start
+
+    mismatches = [seed for seed, (score, ticks) in zip(seeds, scalar)
+                  if (batch.scores[seed], batch.ticks[seed]) != (score, ticks)]
+    summary = score_distribution(batch.scores)
+    print(f"games            {args.games}")
+    print(f"mean score       {summary['mean']:.2f} (p50 {summary['percentiles']['p50']:.0f}, "
+          f"max {summary['max']})")
+    print(f"scalar           {args.games / scalar_time:10.1f} games/s")
+    print(f"batched          {args.games / batch_time:10.1f} games/s "
+          f"({scalar_time / batch_time:.1f}x)")
+    print(f"mismatches       {len(mismatches)}")
+    if mismatches:
+        sys.exit(f"batched results differ from Simulation for seeds {mismatches[:10]}")
+
+
+if __name__ == "__main__":
+    main()
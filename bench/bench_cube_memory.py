@@ -0,0 +1,90 @@
+"""
+Memory benchmark: bytes per cube for a 10k-cube stack.
+
+Compares the original __dict__-based Cube dataclass (reproduced here), the
+slotted Cube from models, and the struct-of-arrays Stack.
+
+Usage:
+    python bench/bench_cube_memory.py [--cubes N]
+"""
+
+import argparse
+import os
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from models import Cube
+from cube_stack import Stack
+
+
+@dataclass
+class DictCube:
+    """The pre-slots Cube layout: same fields, stored in a __dict__."""
+    position: List[float]
+    rotation: List[float]
+    size: List[float]
+    direction: List[float] = field(default_factory=lambda: [0.0, 0.0, 0.0])
+    moving_state: int = 0
+    spawn: List[float] = field(default_factory=lambda: [0.0, 0.0, 0.0])
+    target: List[float] = field(default_factory=lambda: [0.0, 0.0, 0.0])
+    travel_distance: float = 0.0
+    traveled: float = 0.0
+    texture_id: str = "normal"
+
+
+def make_dict_cube(i: int) -> DictCube:
+    y = 2.0 * i
+    return DictCube(position=[0.01 * i, y, -0.01 * i], rotation=[0.0, 0.0, 0.0],
+                    size=[2.0 - 1e-4 * i, 2.0, 2.0 - 2e-4 * i],
+                    direction=[0.1, 0.0, -0.1], spawn=[5.0, y, 5.0], target=[0.0, y, 0.0],
+                    travel_distance=7.07, traveled=3.5)
+
+
+def make_cube(i: int) -> Cube:
+    y = 2.0 * i
+    return Cube(position=[0.01 * i, y, -0.01 * i], rotation=[0.0, 0.0, 0.0],
+                size=[2.0 - 1e-4 * i, 2.0, 2.0 - 2e-4 * i],
+                direction=[0.1, 0.0, -0.1], spawn=[5.0, y, 5.0], target=[0.0, y, 0.0],
+                travel_distance=7.07, traveled=3.5)
+
+
+def measure(build) -> int:
+    """Return bytes still allocated after build() (the result is kept alive)."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return after - before
+
+
+def build_stack(n: int) -> Stack:
+    stack = Stack()
+    for i in range(n):
+        stack.append(make_cube(i))
+    return stack
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cubes", type=int, default=10_000)
+    args = parser.parse_args()
+    n = args.cubes
+
+    results = [
+        ("dict Cube", measure(lambda: [make_dict_cube(i) for i in range(n)])),
+        ("slotted Cube", measure(lambda: [make_cube(i) for i in range(n)])),
+        ("Stack (SoA)", measure(lambda: build_stack(n))),
+    ]
+    print(f"{'layout':<18}{'total KiB':>12}{'bytes/cube':>12}")
+    for name, total in results:
+        print(f"{name:<18}{total / 1024:>12.1f}{total / n:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
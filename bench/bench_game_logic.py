@@ -0,0 +1,222 @@
+"""
+Micro-benchmarks for game_logic and cube_special, plus a long-game
+scenario of 100k drops that exposes anything growing with stack height.
+
+Every case uses fixed seeds, and results can be written as JSON (one
+record per case, in the spirit of pytest-benchmark's output) and compared
+against an earlier run's file to diff revisions.
+
+Usage:
+    python bench/bench_game_logic.py [--rounds R] [--drops N]
+        [--json PATH] [--compare PATH]
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from models import Cube
+from game_logic import intersect_rect, trim_or_lose, spawn_next_cube, update_cube_motion
+from cube_special import teleport_forward, apply_random_acceleration
+from simulation import Simulation
+from config import INITIAL_CUBE_POS, INITIAL_CUBE_SIZE, ACCELERATION_RANGE
+
+SEED = 1234
+
+
+def base_stack() -> List[Cube]:
+    """The starting cube plus a seeded moving cube, as a game begins."""
+    stack = [Cube(position=list(INITIAL_CUBE_POS), rotation=[0.0, 0.0, 0.0],
+                  size=list(INITIAL_CUBE_SIZE))]
+    spawn_next_cube(stack, random.Random(SEED))
+    return stack
+
+
+def case_intersect_rect() -> Callable[[], None]:
+    r1, r2 = (-1.0, -1.0, 2.0, 2.0), (-0.7, -1.2, 2.0, 1.9)
+    return lambda: intersect_rect(r1, r2)
+
+
+def case_trim_or_lose() -> Callable[[], None]:
+    stack = base_stack()
+    stack[-1].position[0] = stack[-1].target[0] + 0.3
+    stack[-1].position[2] = stack[-1].target[2] - 0.2
+    # Trimming is idempotent once applied, so repeated calls do equal work
+    return lambda: trim_or_lose(stack)
+
+
+def case_spawn_next_cube() -> Callable[[], None]:
+    stack = base_stack()
+    rng = random.Random(SEED)
+
+    def run():
+        spawn_next_cube(stack, rng)
+        stack.pop()
+    return run
+
+
+def case_update_cube_motion() -> Callable[[], None]:
+    cube = base_stack()[-1]
+    return lambda: update_cube_motion(cube)
+
+
+def case_teleport_forward() -> Callable[[], None]:
+    cube = base_stack()[-1]
+    cube.traveled = cube.travel_distance * 0.5
+    rng = random.Random(SEED)
+    return lambda: teleport_forward(cube, rng)
+
+
+def case_apply_random_acceleration() -> Callable[[], None]:
+    cube = base_stack()[-1]
+    rng = random.Random(SEED)
+    low, high = ACCELERATION_RANGE
+    return lambda: apply_random_acceleration(cube, low, high, rng=rng)
+
+
+CASES = {
+    "intersect_rect": case_intersect_rect,
+    "trim_or_lose": case_trim_or_lose,
+    "spawn_next_cube": case_spawn_next_cube,
+    "update_cube_motion": case_update_cube_motion,
+    "teleport_forward": case_teleport_forward,
+    "apply_random_acceleration": case_apply_random_acceleration,
+}
+
+
+def measure(func: Callable[[], None], rounds: int, number: int) -> Dict[str, float]:
+    """
+    Time rounds batches of number calls.
+
+    Returns:
+        Dict[str, float]: min/median/mean/stddev in ns per call, and ops/s
+            from the median.
+    """
+    per_call = []
+    for _ in range(rounds):
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            func()
+        per_call.append((time.perf_counter_ns() - start) / number)
+    median = statistics.median(per_call)
+    return {
+        "min_ns": min(per_call),
+        "median_ns": median,
+        "mean_ns": statistics.fmean(per_call),
+        "stddev_ns": statistics.stdev(per_call) if rounds > 1 else 0.0,
+        "ops": 1e9 / median,
+        "rounds": rounds,
+        "number": number,
+    }
+
+
+LONG_GAME_SEGMENTS = 10
+MIN_LONG_GAME_SEGMENTS = 6      # the first and last three must not overlap
+
+
+def long_game(drops: int, segments: int = LONG_GAME_SEGMENTS,
+              ticks_per_drop: int = 10) -> Dict[str, object]:
+    """
+    Play one seeded game of a given number of drops, moving each cube for
+    a few ticks and then dropping it exactly on its target so the game
+    never ends, and time the drops in consecutive segments. Segment sizes
+    differ by at most one drop, so every drop is timed.
+
+    Parameters:
+        drops (int): Drops to play; at least segments.
+        segments (int): Number of timed segments; at least
+            MIN_LONG_GAME_SEGMENTS.
+        ticks_per_drop (int): Ticks the cube moves before each drop.
+
+    Returns:
+        Dict[str, object]: Drops/s per segment and the ratio of the median
+            of the first three segments' rates to that of the last three
+            (about 1 when the cost per drop does not grow with the stack).
+
+    Raises:
+        ValueError: If segments or drops is too small.
+    """
+    if segments < MIN_LONG_GAME_SEGMENTS:
+        raise ValueError(f"need at least {MIN_LONG_GAME_SEGMENTS} segments")
+    if drops < segments:
+        raise ValueError(f"need at least one drop per segment ({segments})")
+    sim = Simulation(SEED)
+    rates = []
+    done = 0
+    for k in range(1, segments + 1):
+        end = k * drops // segments
+        start = time.perf_counter()
+        for _ in range(end - done):
+            sim.run(ticks_per_drop)
+            active = sim.active
+            active.position[0] = active.target[0]
+            active.position[2] = active.target[2]
+            sim.drop()
+        rates.append((end - done) / (time.perf_counter() - start))
+        done = end
+    return {
+        "drops": drops,
+        "score": sim.score,
+        "segments": segments,
+        "drops_per_s": rates,
+        # Medians of three segments each, to ride out scheduler noise
+        "growth": statistics.median(rates[:3]) / statistics.median(rates[-3:]),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--number", type=int, default=10000, help="calls per round")
+    parser.add_argument("--drops", type=int, default=100000,
+                        help=f"drops in the long game (at least {LONG_GAME_SEGMENTS})")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--compare", help="earlier --json file to compare against")
+    args = parser.parse_args()
+    if args.drops < LONG_GAME_SEGMENTS:
+        parser.error(f"--drops must be at least {LONG_GAME_SEGMENTS}")
+
+    results = {}
+    for name, make in CASES.items():
+        results[name] = measure(make(), args.rounds, args.number)
+    game = long_game(args.drops)
+
+    previous = {}
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)["benchmarks"]
+
+    print(f"{'case':28} {'median ns':>10} {'stddev':>8} {'ops/s':>12}"
+          + ("   vs previous" if previous else ""))
+    for name, stats in results.items():
+        line = (f"{name:28} {stats['median_ns']:10.1f} {stats['stddev_ns']:8.1f} "
+                f"{stats['ops']:12.0f}")
+        if name in previous:
+            line += f"   {stats['median_ns'] / previous[name]['median_ns']:6.2f}x time"
+        print(line)
+    print(f"long game: {game['drops']} drops, score {game['score']}, "
+          f"{game['drops_per_s'][0]:.0f} -> {game['drops_per_s'][-1]:.0f} drops/s "
+          f"(growth {game['growth']:.2f}x)")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({
+                "machine": {"python": platform.python_version(),
+                            "implementation": platform.python_implementation(),
+                            "machine": platform.machine()},
+                "seed": SEED,
+                "benchmarks": results,
+                "long_game": game,
+            }, f, indent=2, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Overlap benchmark: rectangles/sec of intersect_rect in a Python loop
+against intersect_rect_array, and a bit-for-bit check of the results.
+
+Rectangles are drawn from a fixed seed around the starting base cube, so
+about a quarter of the pairs overlap.
+
+Usage:
+    python bench/bench_intersect.py [--rects N] [--repeat R]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import numpy as np
+from game_logic import intersect_rect, intersect_rect_array
+
+
+def make_rects(count: int, seed: int = 0) -> np.ndarray:
+    """(count, 4) candidate rectangles scattered around (-1, -1, 2, 2)."""
+    rng = np.random.default_rng(seed)
+    rects = np.empty((count, 4))
+    rects[:, :2] = rng.uniform(-4.0, 2.0, (count, 2))
+    rects[:, 2:] = rng.uniform(0.1, 2.0, (count, 2))
+    return rects
+
+
+def best_time(func, repeat: int) -> float:
+    """Fastest of repeat runs of func(), in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rects", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    base = np.array([-1.0, -1.0, 2.0, 2.0])
+    rects = make_rects(args.rects)
+    base_tuple = tuple(base.tolist())
+    rect_tuples = [tuple(r) for r in rects.tolist()]
+
+    scalar = [intersect_rect(base_tuple, r) for r in rect_tuples]
+    overlaps, valid = intersect_rect_array(base, rects)
+    mismatches = sum(
+        (expected is None) != (not ok) or (ok and tuple(row.tolist()) != expected)
+        for expected, row, ok in zip(scalar, overlaps, valid)
+    )
+
+    scalar_time = best_time(lambda: [intersect_rect(base_tuple, r) for r in rect_tuples],
+                            args.repeat)
+    array_time = best_time(lambda: intersect_rect_array(base, rects), args.repeat)
+
+    print(f"rects            {args.rects} ({int(valid.sum())} overlapping)")
+    print(f"intersect_rect   {args.rects / scalar_time / 1e6:8.2f} M rects/s")
+    print(f"array version    {args.rects / array_time / 1e6:8.2f} M rects/s "
+          f"({scalar_time / array_time:.0f}x)")
+    print(f"mismatches       {mismatches}")
+    if mismatches:
+        sys.exit("intersect_rect_array differs from intersect_rect")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+"""
+Rendering benchmark: frames/sec and GL calls per frame for synthetic
+stacks drawn through the real renderers and HUD, in an offscreen context.
+
+Each frame does what game_loop does: clear, look at the top of the stack,
+cull to the visible index window, draw the stack and the score, finish.
+GL state calls that gl_state elided are reported next to the calls made.
+Stacks are seeded, with every cube type mixed in, so runs are comparable
+between revisions. GL calls are counted in a separate pass, by wrapping
+the gl* functions the rendering modules imported, so the counting does
+not slow the timed pass.
+
+Runs without a GPU: the default "offscreen" driver uses SDL's offscreen
+video driver with EGL (Mesa llvmpipe works); "x11" uses $DISPLAY, e.g.
+under xvfb-run. The "shader" renderer needs a core-profile context, so it
+is benchmarked on its own.
+
+Usage:
+    python bench/bench_render.py [--sizes 10 100 1000 10000] [--frames N]
+        [--renderers immediate vbo batched cached | shader] [--driver offscreen|x11]
+        [--no-cull] [--textures blob|png] [--json PATH]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+RENDERERS = ("immediate", "vbo", "batched", "cached")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Render synthetic stacks offscreen.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--count-frames", type=int, default=5,
+                        help="frames rendered with GL call counting")
+    parser.add_argument("--renderers", nargs="+", choices=RENDERERS + ("shader",),
+                        default=list(RENDERERS))
+    parser.add_argument("--driver", choices=("offscreen", "x11"), default="offscreen")
+    parser.add_argument("--no-cull", action="store_true", help="draw the whole stack")
+    parser.add_argument("--textures", choices=("blob", "png"), default="blob",
+                        help="atlas source; blob falls back to png when none are built")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+    if "shader" in args.renderers and len(args.renderers) > 1:
+        parser.error("the shader renderer needs its own (core-profile) run")
+    return args
+
+
+args = parse_args()
+if args.driver == "offscreen":
+    # Must be set before pygame and PyOpenGL are imported
+    os.environ["SDL_VIDEODRIVER"] = "offscreen"
+    os.environ.setdefault("PYOPENGL_PLATFORM", "egl")
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+import random
+import pygame
+from pygame.locals import DOUBLEBUF, OPENGL
+from OpenGL.GL import *
+from OpenGL.GLU import *
+
+from models import Cube
+from cube_stack import Stack
+from game_logic import spawn_next_cube
+from game import compute_camera_position
+from culling import frustum_y_range, visible_index_range
+import graphics
+import vbo_renderer
+import batch_renderer
+import stack_cache
+import shader_renderer
+import hud
+import gl_state
+from texture_manager import TextureManager
+from config import (
+    DISPLAY, SCREEN_WIDTH, SCREEN_HEIGHT, INITIAL_CUBE_POS, INITIAL_CUBE_SIZE,
+    INITIAL_AZIMUTH, INITIAL_ELEVATION, INITIAL_RADIUS, CAMERA_Y_OFFSET,
+    FOV_Y, NEAR_PLANE, FAR_PLANE, ASSET_BUILD_DIR
+)
+
+texture_manager = TextureManager(blob_directory=ASSET_BUILD_DIR if args.textures == "blob" else None)
+
+
+def make_stack(size: int, seed: int) -> Stack:
+    """
+    A settled stack of size cubes plus a moving one on top, each offset a
+    little from its target so the trimmed sizes vary.
+    """
+    rng = random.Random(seed)
+    cubes = [Cube(position=list(INITIAL_CUBE_POS), rotation=[0.0, 0.0, 0.0],
+                  size=list(INITIAL_CUBE_SIZE))]
+    for _ in range(size):
+        spawn_next_cube(cubes, rng)
+        cube = cubes[-1]
+        cube.moving_state = 0
+        cube.position[0] = cube.target[0] + rng.uniform(-0.05, 0.05)
+        cube.position[2] = cube.target[2] + rng.uniform(-0.05, 0.05)
+    cubes[-1].moving_state = 1
+    return Stack(cubes)
+
+
+def select_renderer(name: str):
+    """
+    Set up a renderer in the current context, as game_loop does.
+
+    Returns:
+        tuple: (draw_stack, shader, cache) where shader is the ShaderRenderer
+            of the "shader" renderer, cache the StaticStackCache of the
+            "cached" one, and each is None otherwise.
+    """
+    if name == "shader":
+        shader = shader_renderer.ShaderRenderer()
+        return shader.draw_stack, shader, None
+    if name == "vbo":
+        vbo_renderer.init_cube_buffer()
+        return vbo_renderer.draw_stack, None, None
+    if name == "batched":
+        batch_renderer.reset_stream_buffer()
+        return batch_renderer.draw_stack, None, None
+    if name == "cached":
+        vbo_renderer.init_cube_buffer()
+        cache = stack_cache.StaticStackCache()
+        return cache.draw_stack, None, cache
+    return graphics.draw_stack, None, None
+
+
+def render_frame(draw_stack, stack: Stack, cull: bool, shader=None) -> None:
+    """One game_loop frame, looking at the top of the stack."""
+    focus = stack[-2]
+    glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+    camera = compute_camera_position(
+        INITIAL_AZIMUTH, INITIAL_ELEVATION, INITIAL_RADIUS,
+        focus.position[0] + focus.size[0] / 2.0,
+        focus.position[1] + focus.size[1] / 2.0,
+        focus.position[2] + focus.size[2] / 2.0, y_lift=CAMERA_Y_OFFSET
+    )
+    if shader:
+        shader.set_camera(camera)
+    else:
+        glLoadIdentity()
+        gluLookAt(*camera, 0, 1, 0)
+    window = None
+    if cull:
+        y_min, y_max = frustum_y_range(camera, FOV_Y, SCREEN_WIDTH / SCREEN_HEIGHT,
+                                       NEAR_PLANE, FAR_PLANE)
+        window = visible_index_range(len(stack), y_min, y_max)
+    draw_stack(stack, window)
+    if shader:
+        shader.draw_text(f"Score: {len(stack) - 2}", 20, SCREEN_HEIGHT - 40)
+        shader.flush_text()
+    else:
+        hud.draw_hud_text(f"Score: {len(stack) - 2}", 20, SCREEN_HEIGHT - 40)
+    gl_state.end_frame()
+    glFinish()
+
+
+class GLCallCounter:
+    """Counts calls to the gl*/glu* functions bound in a set of modules."""
+
+    def __init__(self, modules):
+        self.modules = modules
+        self.calls = Counter()
+        self._originals = []
+
+    def _wrap(self, name, func):
+        calls = self.calls
+
+        def counted(*a, **kw):
+            calls[name] += 1
+            return func(*a, **kw)
+        return counted
+
+    def install(self) -> None:
+        for module in self.modules:
+            for name, value in list(vars(module).items()):
+                if name.startswith("gl") and callable(value):
+                    self._originals.append((module, name, value))
+                    setattr(module, name, self._wrap(name, value))
+
+    def uninstall(self) -> None:
+        for module, name, value in self._originals:
+            setattr(module, name, value)
+        self._originals = []
+
+
+def bench(renderer: str, size: int) -> dict:
+    pygame.display.set_mode(DISPLAY, DOUBLEBUF | OPENGL)
+    glEnable(GL_DEPTH_TEST)
+    if renderer != "shader":
+        glMatrixMode(GL_PROJECTION)
+        glLoadIdentity()
+        gluPerspective(FOV_Y, SCREEN_WIDTH / SCREEN_HEIGHT, NEAR_PLANE, FAR_PLANE)
+        glMatrixMode(GL_MODELVIEW)
+    hud.reset_hud_cache()
+    gl_state.reset_state()
+    texture_manager.acquire()
+
+    stack = make_stack(size, args.seed)
+    draw_stack, shader, cache = select_renderer(renderer)
+    cull = not args.no_cull
+
+    # Warm-up: atlas, buffers and caches are built outside the timed frames
+    for _ in range(3):
+        render_frame(draw_stack, stack, cull, shader)
+
+    start = time.perf_counter()
+    for _ in range(args.frames):
+        render_frame(draw_stack, stack, cull, shader)
+        pygame.display.flip()
+    elapsed = time.perf_counter() - start
+
+    counter = GLCallCounter([graphics, vbo_renderer, batch_renderer, stack_cache, hud,
+                             shader_renderer, gl_state, sys.modules[__name__]])
+    counter.install()
+    avoided = 0
+    try:
+        for _ in range(args.count_frames):
+            render_frame(draw_stack, stack, cull, shader)
+            avoided += gl_state.last_frame()[1]
+    finally:
+        counter.uninstall()
+    # Each run gets a new display; free this one's GL objects first
+    if shader:
+        shader.release()
+    if cache:
+        cache.release()
+    vbo_renderer.release_cube_buffer()
+    batch_renderer.release_stream_buffer()
+    hud.release_hud_cache()
+
+    per_frame = {name: count / args.count_frames for name, count in counter.calls.items()}
+    return {
+        "renderer": renderer,
+        "cubes": size,
+        "fps": args.frames / elapsed,
+        "ms_per_frame": elapsed / args.frames * 1000.0,
+        "gl_calls_per_frame": sum(per_frame.values()),
+        "state_calls_elided_per_frame": avoided / args.count_frames,
+        "gl_calls": dict(sorted(per_frame.items(), key=lambda item: -item[1])),
+    }
+
+
+def gl_renderer_name() -> str:
+    """GL_RENDERER string of the driver in use (e.g. llvmpipe)."""
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode(DISPLAY, DOUBLEBUF | OPENGL)
+    return glGetString(GL_RENDERER).decode()
+
+
+def main() -> None:
+    pygame.init()
+    if args.renderers == ["shader"]:
+        shader_renderer.request_core_profile()
+    print(f"{gl_renderer_name()} | cull={'off' if args.no_cull else 'on'} | "
+          f"{args.textures} textures | {args.frames} frames")
+    print(f"{'renderer':10} {'cubes':>6} {'fps':>9} {'ms/frame':>9} {'GL calls/frame':>15} "
+          f"{'elided/frame':>13}")
+    results = []
+    for renderer in args.renderers:
+        for size in args.sizes:
+            result = bench(renderer, size)
+            results.append(result)
+            print(f"{renderer:10} {size:6d} {result['fps']:9.1f} "
+                  f"{result['ms_per_frame']:9.3f} {result['gl_calls_per_frame']:15.0f} "
+                  f"{result['state_calls_elided_per_frame']:13.0f}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"gl_renderer": gl_renderer_name(), "cull": not args.no_cull,
+                       "textures": args.textures, "frames": args.frames,
+                       "results": results}, f, indent=2)
+    texture_manager.release()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Startup texture load time: PNG decode + upload against the prebuilt
+mipmapped DXT1 blobs from build_assets.py, in an offscreen context.
+
+Each run starts from a fresh TextureManager, so file reads and decoding
+are included, and ends with glFinish so the upload is complete. Run
+build_assets.py first; without blobs both paths load the PNGs.
+
+Usage:
+    python bench/bench_texture_load.py [--runs N] [--driver offscreen|x11] [--json PATH]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Time texture loading from PNGs and blobs.")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--driver", choices=("offscreen", "x11"), default="offscreen")
+    parser.add_argument("--json", help="also write the results to this file")
+    return parser.parse_args()
+
+
+args = parse_args()
+if args.driver == "offscreen":
+    # Must be set before pygame and PyOpenGL are imported
+    os.environ["SDL_VIDEODRIVER"] = "offscreen"
+    os.environ.setdefault("PYOPENGL_PLATFORM", "egl")
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+import pygame
+from pygame.locals import DOUBLEBUF, OPENGL
+from OpenGL.GL import *
+
+from texture_manager import TextureManager
+from config import DISPLAY, ASSET_BUILD_DIR
+
+
+def load_once(blob_directory) -> tuple:
+    """Seconds for one cold acquire(), and the manager's stats after it."""
+    manager = TextureManager(blob_directory=blob_directory)
+    start = time.perf_counter()
+    manager.acquire()
+    glFinish()
+    elapsed = time.perf_counter() - start
+    stats = manager.stats()
+    manager.release()
+    return elapsed, stats
+
+
+def bench(label: str, blob_directory) -> dict:
+    load_once(blob_directory)   # warm the OS file cache and the driver
+    times = []
+    for _ in range(args.runs):
+        elapsed, stats = load_once(blob_directory)
+        times.append(elapsed)
+    return {
+        "path": label,
+        "median_ms": statistics.median(times) * 1000.0,
+        "min_ms": min(times) * 1000.0,
+        "blob_uploads": stats["blob_uploads"],
+        "resident_bytes": stats["resident_bytes"],
+    }
+
+
+def main() -> None:
+    pygame.init()
+    pygame.display.set_mode(DISPLAY, DOUBLEBUF | OPENGL)
+    print(f"{glGetString(GL_RENDERER).decode()} | {args.runs} runs")
+    print(f"{'path':6} {'median ms':>10} {'min ms':>8} {'from blobs':>11} {'GL bytes':>10}")
+    results = [bench("png", None), bench("blob", ASSET_BUILD_DIR)]
+    for result in results:
+        print(f"{result['path']:6} {result['median_ms']:10.2f} {result['min_ms']:8.2f} "
+              f"{result['blob_uploads']:11d} {result['resident_bytes']:10d}")
+    if results[1]["blob_uploads"] == 0:
+        print(f"no blobs were used; run build_assets.py to create {ASSET_BUILD_DIR}")
+    else:
+        print(f"blob load is {results[0]['median_ms'] / results[1]['median_ms']:.1f}x faster")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"gl_renderer": glGetString(GL_RENDERER).decode(),
+                       "runs": args.runs, "results": results}, f, indent=2)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
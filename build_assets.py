@@ -0,0 +1,121 @@
+"""
+Offline asset build: turns assets/textures/*.png into GPU-ready texture
+blobs (box-filtered mip chain, DXT1-compressed) under ASSET_BUILD_DIR.
+
+The game uploads a blob directly when it is newer than its PNG and the
+driver supports S3TC, and falls back to the PNG otherwise.
+
+Usage:
+    python build_assets.py [--source DIR] [--output DIR]
+"""
+
+import argparse
+import os
+import time
+from typing import List
+import numpy as np
+import pygame
+from texture_blob import BLOB_EXTENSION, MipLevel, write_blob
+from config import TEXTURE_DIR, ASSET_BUILD_DIR
+
+
+def load_rgb(path: str) -> np.ndarray:
+    """(height, width, 3) uint8 pixels, rows bottom-up as GL expects."""
+    surface = pygame.image.load(path)
+    width, height = surface.get_size()
+    data = pygame.image.tostring(surface, "RGB", True)
+    return np.frombuffer(data, dtype=np.uint8).reshape(height, width, 3)
+
+
+def build_mipmaps(rgb: np.ndarray) -> List[np.ndarray]:
+    """Mip chain down to 1x1, each level a 2x2 box filter of the previous."""
+    levels = [rgb]
+    while max(levels[-1].shape[:2]) > 1:
+        level = levels[-1]
+        height, width = level.shape[:2]
+        fy, fx = (2 if height > 1 else 1), (2 if width > 1 else 1)
+        h, w = height // fy, width // fx
+        blocks = level[:h * fy, :w * fx].astype(np.float32).reshape(h, fy, w, fx, 3)
+        levels.append(np.round(blocks.mean(axis=(1, 3))).astype(np.uint8))
+    return levels
+
+
+def _to_565(colors: np.ndarray) -> np.ndarray:
+    scaled = np.round(np.clip(colors, 0, 255) * np.array([31, 63, 31]) / 255.0).astype(np.uint16)
+    return (scaled[..., 0] << 11) | (scaled[..., 1] << 5) | scaled[..., 2]
+
+
+def _from_565(packed: np.ndarray) -> np.ndarray:
+    r = (packed >> 11) & 31
+    g = (packed >> 5) & 63
+    b = packed & 31
+    # Expand by bit replication, as decoders do
+    return np.stack(((r << 3) | (r >> 2), (g << 2) | (g >> 4), (b << 3) | (b >> 2)),
+                    axis=-1).astype(np.float32)
+
+
+def encode_dxt1(rgb: np.ndarray) -> bytes:
+    """
+    Compress an image to DXT1 blocks (4-colour mode, 8 bytes per 4x4).
+
+    Endpoints span each block's colours along their principal axis; every
+    texel takes the nearest of the four palette entries.
+    """
+    height, width = rgb.shape[:2]
+    padded = np.pad(rgb, ((0, -height % 4), (0, -width % 4), (0, 0)), mode="edge")
+    rows, cols = padded.shape[0] // 4, padded.shape[1] // 4
+    blocks = (padded.astype(np.float32).reshape(rows, 4, cols, 4, 3)
+              .swapaxes(1, 2).reshape(-1, 16, 3))
+
+    mean = blocks.mean(axis=1)
+    centered = blocks - mean[:, None, :]
+    covariance = np.einsum("nki,nkj->nij", centered, centered)
+    axis = np.linalg.eigh(covariance)[1][:, :, -1]
+    projected = np.einsum("nki,ni->nk", centered, axis)
+    c0 = _to_565(mean + projected.max(axis=1)[:, None] * axis)
+    c1 = _to_565(mean + projected.min(axis=1)[:, None] * axis)
+    # 4-colour mode needs c0 > c1 as integers
+    c0, c1 = np.maximum(c0, c1), np.minimum(c0, c1)
+
+    p0, p1 = _from_565(c0), _from_565(c1)
+    palette = np.stack((p0, p1, (2 * p0 + p1) / 3, (p0 + 2 * p1) / 3), axis=1)
+    distance = ((blocks[:, :, None, :] - palette[:, None, :, :]) ** 2).sum(axis=-1)
+    indices = distance.argmin(axis=-1).astype(np.uint32)
+    indices[c0 == c1] = 0
+    bits = (indices << (2 * np.arange(16, dtype=np.uint32))).sum(axis=1, dtype=np.uint32)
+
+    out = np.empty(len(blocks), dtype=[("c0", "<u2"), ("c1", "<u2"), ("bits", "<u4")])
+    out["c0"], out["c1"], out["bits"] = c0, c1, bits
+    return out.tobytes()
+
+
+def build_texture(png_path: str, blob_path: str) -> int:
+    """Build one blob from one PNG; returns the blob's size in bytes."""
+    levels: List[MipLevel] = [
+        (level.shape[1], level.shape[0], encode_dxt1(level))
+        for level in build_mipmaps(load_rgb(png_path))
+    ]
+    return write_blob(blob_path, levels)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build GPU-ready texture blobs from PNGs.")
+    parser.add_argument("--source", default=TEXTURE_DIR)
+    parser.add_argument("--output", default=ASSET_BUILD_DIR)
+    args = parser.parse_args()
+
+    os.makedirs(args.output, exist_ok=True)
+    for name in sorted(os.listdir(args.source)):
+        stem, ext = os.path.splitext(name)
+        if ext.lower() != ".png":
+            continue
+        png_path = os.path.join(args.source, name)
+        blob_path = os.path.join(args.output, stem + BLOB_EXTENSION)
+        start = time.perf_counter()
+        size = build_texture(png_path, blob_path)
+        print(f"{png_path} -> {blob_path}: {os.path.getsize(png_path)} B png, "
+              f"{size} B blob ({time.perf_counter() - start:.2f} s)")
+
+
+if __name__ == "__main__":
+    main()
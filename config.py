@@ -2,8 +2,6 @@
 Global configuration constants for window, assets, gameplay, and camera.
 """
 
-import pygame
-
 
 # # Window
 SCREEN_WIDTH = 1200
@@ -13,7 +11,12 @@ WINDOW_TITLE = "3D Cube Stacking"
 
 # Assets
 FONT_PATH = "assets/font_pixel.ttf"
+TEXTURE_DIR = "assets/textures"
+ASSET_BUILD_DIR = "assets/build"  # mipmapped DXT1 blobs written by build_assets.py
 LEADERBOARD_FILE = "record.txt"
+FONT_CACHE_SIZE = 8            # fonts kept loaded (one per size)
+TEXT_CACHE_SIZE = 256          # rendered strings kept for the 2D screens
+REPLAY_DIR = "replays"          # one replay file (seed + drop ticks) per game
 
 # Gameplay
 INITIAL_CUBE_POS = (-1.0, -1.0, -1.0)
@@ -21,7 +24,11 @@ INITIAL_CUBE_SIZE = (2.0, 2.0, 2.0)
 SPAWN_RADIUS = 10.0            # distance from target for new cube spawn
 STACK_HEIGHT_STEP = 2.0        # vertical step when spawning a new cube
 ARRIVAL_FRAMES = 100.0         # frames to reach target (controls speed)
-MAX_DISPLAY_SCORES = 10        # number of scores stored
+MAX_DISPLAY_SCORES = 10        # number of scores shown
+MAX_STORED_SCORES = 1000       # number of scores kept in the leaderboard file
+LEADERBOARD_FLUSH_INTERVAL = 60.0  # seconds new scores may wait to be written (always on exit)
+SPECIAL_INTERVAL_TICKS = 80    # ticks between special-cube effects
+ACCELERATION_RANGE = (0.1, 3.0)  # speed clamp for "var_a" cubes, x base speed
 
 # Camera
 INITIAL_AZIMUTH = 45.0         # degrees
@@ -32,19 +39,48 @@ ELEVATION_MAX = 89.9
 MOUSE_SENSITIVITY = 0.3
 ZOOM_STEP = 0.5
 CAMERA_Y_OFFSET = 1.0          # small lift above the cube center
+FOV_Y = 45.0                   # vertical field of view, degrees
+NEAR_PLANE = 0.1
+FAR_PLANE = 50.0
 
 # import Timing
-FRAME_DELAY_MS = 10
+SIMULATION_HZ = 100            # fixed simulation ticks per second
+TARGET_FPS = 60                # render rate cap
+MAX_FRAME_SKIP = 5             # frames that may go undrawn while catching up
+IDLE_WAIT_MS = 500             # longest block on the event queue in 2D screens
+
+# Replay verification (bounds on what a claimed game may ask to re-simulate)
+REPLAY_MAX_DROPS = 20000       # drops per game
+REPLAY_MAX_TICK_GAP = 600 * SIMULATION_HZ     # ticks between two drops (10 minutes)
+REPLAY_MAX_TICKS = 7200 * SIMULATION_HZ       # ticks per game (2 hours)
+
+# Rendering
+RENDERER = "immediate"         # "immediate", "vbo", "batched", "cached" or "shader" (GL 3.3 core)
+CULLING_ENABLED = True         # skip cubes outside the view frustum's height
+
+# Profiling
+PROFILER_ENABLED = False       # time each phase of the game loop's frames
+PROFILER_OVERLAY = True        # show frame-time percentiles while profiling
+PROFILER_WINDOW = 600          # frames in the rolling percentile window
+PROFILER_MAX_ROWS = 36000      # frames kept for dumps (the last 10 minutes at 60 fps)
+PROFILE_DIR = "profiles"       # per-game CSV/JSON timing dumps
+
+# Autoplay
+AUTOPLAY = False               # let autoplay.AutoPlayer drop the cubes (soak testing)
+AUTOPLAY_SPEED = 1             # simulation ticks per scheduled tick while autoplaying
+AUTOPLAY_TEXTURES = None       # cube types spawned while autoplaying; ["normal"] never misses
 
-# Variable assets
+# Variable assets (each name is one tile of the atlas, in key order)
 textures = {
     "normal": None,
     "var_a": None,
     "var_pos": None
 }
+texture_atlas = {"id": None}   # GL texture holding every tile; textures[name] is this id too
 
 def init_config():
-    # Window initialize
+    # Window initialize (imported here so headless tools never load pygame)
+    import pygame
     pygame.init()
     # display_info = pygame.display.Info()
     # SCREEN_WIDTH, SCREEN_HEIGHT = display_info.current_w, display_info.current_h
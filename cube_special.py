@@ -7,16 +7,14 @@ import random
 from models import Cube
 
 
-import random
-from models import Cube
-
-def teleport_forward(cube: Cube) -> None:
+def teleport_forward(cube: Cube, rng=random) -> None:
     """
     Teleport the cube to a random forward position along its spawn→target line,
     constrained to the direction it is currently moving.
 
     Parameters:
         cube (Cube): The cube to teleport.
+        rng: Random source (random.Random or the random module).
     """
     # Current progress fraction (0 = spawn, 1 = target)
     if cube.travel_distance == 0:
@@ -25,10 +23,9 @@ def teleport_forward(cube: Cube) -> None:
 
     # Only allow teleport further along the line (frontwards)
     if cube.moving_state == 1:
-        new_fraction = random.uniform(current_fraction, min(2.0, current_fraction+0.25))
+        new_fraction = rng.uniform(current_fraction, min(2.0, current_fraction+0.25))
     else:
-        new_fraction = random.uniform(max(0.0, current_fraction-0.25), current_fraction)
-    print("teleport", new_fraction)
+        new_fraction = rng.uniform(max(0.0, current_fraction-0.25), current_fraction)
 
     # Interpolate between spawn and target
     new_x = cube.spawn[0] + new_fraction * (cube.target[0] - cube.spawn[0])
@@ -46,7 +43,8 @@ def teleport_forward(cube: Cube) -> None:
 def apply_random_acceleration(
     cube: Cube,
     min_factor: float = 0.1,
-    max_factor: float = 10.0
+    max_factor: float = 10.0,
+    rng=random
 ) -> None:
     """
     Apply a random acceleration to the cube's velocity, but clamp the final
@@ -56,13 +54,14 @@ def apply_random_acceleration(
         cube (Cube): The cube to modify.
         min_factor (float): Minimum allowed speed multiplier relative to base speed.
         max_factor (float): Maximum allowed speed multiplier relative to base speed.
+        rng: Random source (random.Random or the random module).
     """
     # Compute current velocity magnitude in XZ plane
     vx, _, vz = cube.direction
     current_speed = math.sqrt(vx**2 + vz**2)
 
     # Choose a random multiplier
-    multiplier = random.uniform(0.5, 1.5)  # tweak range as desired
+    multiplier = rng.uniform(0.5, 1.5)  # tweak range as desired
     new_speed = current_speed * multiplier
 
     # Clamp new speed between limits
@@ -79,14 +78,15 @@ def apply_random_acceleration(
         cube.direction[2] = norm_z * new_speed
 
 
-def apply_random_rotation(cube: Cube, max_angle: float = 5.0) -> None:
+def apply_random_rotation(cube: Cube, max_angle: float = 5.0, rng=random) -> None:
     """
     Apply a small random rotation to the latest cube.
 
     Parameters:
         cube (Cube): The cube to modify.
         max_angle (float): Maximum rotation angle in degrees.
+        rng: Random source (random.Random or the random module).
     """
-    cube.rotation[0] += random.uniform(-max_angle, max_angle)
-    cube.rotation[1] += random.uniform(-max_angle, max_angle)
-    cube.rotation[2] += random.uniform(-max_angle, max_angle)
+    cube.rotation[0] += rng.uniform(-max_angle, max_angle)
+    cube.rotation[1] += rng.uniform(-max_angle, max_angle)
+    cube.rotation[2] += rng.uniform(-max_angle, max_angle)
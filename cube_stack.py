@@ -0,0 +1,145 @@
+"""
+Array-backed stack of cubes (struct of arrays).
+
+Settled cubes are packed into contiguous float32/uint8 arrays; only the top
+two cubes (the one being dropped onto and the moving one) stay full Cube
+objects, since those are the only ones the game rules read or modify.
+"""
+
+from typing import Iterable, List
+import numpy as np
+from models import Cube
+from config import textures
+
+
+TEXTURE_NAMES = list(textures)
+TEXTURE_INDEX = {name: i for i, name in enumerate(TEXTURE_NAMES)}
+
+TAIL_LENGTH = 2     # cubes kept as Cube objects at the top of the stack
+
+
+class CubeView:
+    """
+    Read-mostly view of one packed cube. position, size and rotation are
+    float32 rows of the stack's arrays (writes go straight to the arrays).
+    """
+    __slots__ = ("_stack", "_index")
+
+    moving_state = 0
+
+    def __init__(self, stack: "Stack", index: int):
+        self._stack = stack
+        self._index = index
+
+    @property
+    def position(self) -> np.ndarray:
+        return self._stack.positions[self._index]
+
+    @property
+    def size(self) -> np.ndarray:
+        return self._stack.sizes[self._index]
+
+    @property
+    def rotation(self) -> np.ndarray:
+        return self._stack.rotations[self._index]
+
+    @property
+    def texture_id(self) -> str:
+        return TEXTURE_NAMES[self._stack.texture_ids[self._index]]
+
+
+class Stack:
+    """
+    List-like container of cubes, bottom to top.
+
+    Indexing returns a CubeView for packed cubes and the Cube object itself
+    for the top TAIL_LENGTH cubes; slicing returns a list of those.
+
+    Attributes:
+        positions (np.ndarray): (capacity, 3) float32 cube origins.
+        sizes (np.ndarray): (capacity, 3) float32 cube dimensions.
+        rotations (np.ndarray): (capacity, 3) float32 rotations in degrees.
+        texture_ids (np.ndarray): (capacity,) uint8 indices into TEXTURE_NAMES.
+        packed (int): Number of cubes (from the bottom) stored only in arrays.
+    """
+
+    def __init__(self, cubes: Iterable[Cube] = (), capacity: int = 64):
+        self.positions = np.zeros((capacity, 3), dtype=np.float32)
+        self.sizes = np.zeros((capacity, 3), dtype=np.float32)
+        self.rotations = np.zeros((capacity, 3), dtype=np.float32)
+        self.texture_ids = np.zeros(capacity, dtype=np.uint8)
+        self.packed = 0
+        self._tail: List[Cube] = []
+        for cube in cubes:
+            self.append(cube)
+
+    def __len__(self) -> int:
+        return self.packed + len(self._tail)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("stack index out of range")
+        if index < self.packed:
+            return CubeView(self, index)
+        return self._tail[index - self.packed]
+
+    def __iter__(self):
+        for i in range(self.packed):
+            yield CubeView(self, i)
+        yield from self._tail
+
+    def append(self, cube: Cube) -> None:
+        """Push a cube on top, packing cubes that fall out of the tail."""
+        self._tail.append(cube)
+        while len(self._tail) > TAIL_LENGTH:
+            self._pack(self._tail.pop(0))
+
+    def _ensure_capacity(self, count: int) -> None:
+        capacity = len(self.texture_ids)
+        if count <= capacity:
+            return
+        while capacity < count:
+            capacity *= 2
+        for name in ("positions", "sizes", "rotations", "texture_ids"):
+            old = getattr(self, name)
+            grown = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            grown[:len(old)] = old
+            setattr(self, name, grown)
+
+    def _write_row(self, index: int, cube: Cube) -> None:
+        self.positions[index] = cube.position
+        self.sizes[index] = cube.size
+        self.rotations[index] = cube.rotation
+        self.texture_ids[index] = TEXTURE_INDEX[cube.texture_id]
+
+    def _pack(self, cube: Cube) -> None:
+        self._ensure_capacity(self.packed + 1)
+        self._write_row(self.packed, cube)
+        self.packed += 1
+
+    def arrays(self, lo: int = 0, hi: int = None):
+        """
+        Return the cubes in [lo, hi) as array views, without copying.
+
+        The tail cubes' current state is written into their rows first, so
+        the views cover the whole stack including the moving cube.
+
+        Returns:
+            tuple: (positions, sizes, rotations, texture_ids) views.
+        """
+        n = len(self)
+        hi = n if hi is None else hi
+        self._ensure_capacity(n)
+        for i, cube in enumerate(self._tail):
+            self._write_row(self.packed + i, cube)
+        return (self.positions[lo:hi], self.sizes[lo:hi],
+                self.rotations[lo:hi], self.texture_ids[lo:hi])
+
+    def nbytes(self) -> int:
+        """Bytes held by the backing arrays."""
+        return (self.positions.nbytes + self.sizes.nbytes +
+                self.rotations.nbytes + self.texture_ids.nbytes)
@@ -0,0 +1,84 @@
+"""
+Vertical-window culling: which stack entries can intersect the view frustum.
+
+Cubes sit at fixed STACK_HEIGHT_STEP intervals above INITIAL_CUBE_POS, so
+the frustum's vertical extent maps to a contiguous range of stack indices
+by arithmetic alone, without testing cubes one by one.
+"""
+
+import math
+from typing import Tuple
+from config import INITIAL_CUBE_POS, INITIAL_CUBE_SIZE, STACK_HEIGHT_STEP
+
+
+def _normalize(v):
+    length = math.sqrt(v[0]**2 + v[1]**2 + v[2]**2)
+    return (v[0] / length, v[1] / length, v[2] / length)
+
+
+def _cross(a, b):
+    return (a[1] * b[2] - a[2] * b[1],
+            a[2] * b[0] - a[0] * b[2],
+            a[0] * b[1] - a[1] * b[0])
+
+
+def frustum_y_range(camera: Tuple[float, float, float, float, float, float],
+                    fov_y: float, aspect: float, near: float, far: float,
+                    up=(0.0, 1.0, 0.0)) -> Tuple[float, float]:
+    """
+    Compute the vertical extent of a gluLookAt/gluPerspective view frustum.
+
+    The frustum is the convex hull of its eight corners, so its lowest and
+    highest points are among them.
+
+    Parameters:
+        camera (tuple): (cam_x, cam_y, cam_z, tar_x, tar_y, tar_z) as returned
+            by compute_camera_position.
+        fov_y (float): Vertical field of view in degrees.
+        aspect (float): Width / height of the viewport.
+        near (float): Near clip distance.
+        far (float): Far clip distance.
+        up (tuple): Up vector passed to gluLookAt.
+
+    Returns:
+        Tuple[float, float]: (y_min, y_max) in world space.
+    """
+    cam_x, cam_y, cam_z, tar_x, tar_y, tar_z = camera
+    forward = _normalize((tar_x - cam_x, tar_y - cam_y, tar_z - cam_z))
+    right = _normalize(_cross(forward, up))
+    true_up = _cross(right, forward)
+
+    tan_half = math.tan(math.radians(fov_y) / 2.0)
+    ys = []
+    for dist in (near, far):
+        half_h = dist * tan_half
+        half_w = half_h * aspect
+        center_y = cam_y + forward[1] * dist
+        for sv in (-1.0, 1.0):
+            for sh in (-1.0, 1.0):
+                ys.append(center_y + sv * half_h * true_up[1] + sh * half_w * right[1])
+    return min(ys), max(ys)
+
+
+def visible_index_range(stack_len: int, y_min: float, y_max: float) -> Tuple[int, int]:
+    """
+    Map a vertical world range to the stack entries that can overlap it.
+
+    Cube i spans [y0 + i * STACK_HEIGHT_STEP, y0 + i * STACK_HEIGHT_STEP + h]
+    where y0 and h come from the initial cube.
+
+    Parameters:
+        stack_len (int): Number of cubes in the stack.
+        y_min (float): Lowest visible world y.
+        y_max (float): Highest visible world y.
+
+    Returns:
+        Tuple[int, int]: Half-open index window (lo, hi) into the stack.
+    """
+    y0 = INITIAL_CUBE_POS[1]
+    height = INITIAL_CUBE_SIZE[1]
+    lo = math.floor((y_min - y0 - height) / STACK_HEIGHT_STEP)
+    hi = math.floor((y_max - y0) / STACK_HEIGHT_STEP) + 1
+    lo = max(0, min(lo, stack_len))
+    hi = max(lo, min(hi, stack_len))
+    return lo, hi
@@ -3,26 +3,41 @@ Main game loop: input handling, camera control, cube movement, and rendering.
 """
 
 import math
-import time
 import pygame
+from contextlib import contextmanager
+from typing import List
 from OpenGL.GL import *
 from OpenGL.GLU import *
 from pygame.locals import DOUBLEBUF, OPENGL
 
 from models import Cube
-from cube_special import apply_random_acceleration, apply_random_rotation, teleport_forward
-from graphics import load_texture, draw_textured_cuboid
-from game_logic import spawn_next_cube, stop_and_spawn
+from simulation import Simulation
+from graphics import draw_stack as draw_stack_immediate
+from texture_manager import acquire_textures, release_textures, texture_stats
+from vbo_renderer import init_cube_buffer, release_cube_buffer, draw_stack as draw_stack_vbo
+from batch_renderer import (
+    reset_stream_buffer, release_stream_buffer, draw_stack as draw_stack_batched
+)
+from stack_cache import StaticStackCache
+from shader_renderer import ShaderRenderer, request_core_profile
+from culling import frustum_y_range, visible_index_range
+from loop_scheduler import FixedStepScheduler
 from leaderboard import update_leaderboard
-from hud import draw_hud_text
+from replay import Replay, save_replay
+from autoplay import AutoPlayer
+from profiler import FrameProfiler
+from hud import draw_hud_text, reset_hud_cache, release_hud_cache
+from gl_state import reset_state, end_frame as end_gl_frame, last_frame, gl_state_stats
 from lose_screen import lose_screen
 from config import (
     DISPLAY, SCREEN_WIDTH, SCREEN_HEIGHT,
-    INITIAL_CUBE_POS, INITIAL_CUBE_SIZE,
     INITIAL_AZIMUTH, INITIAL_ELEVATION, INITIAL_RADIUS,
     ELEVATION_MIN, ELEVATION_MAX, MOUSE_SENSITIVITY,
-    ZOOM_STEP, CAMERA_Y_OFFSET, FRAME_DELAY_MS,
-    LEADERBOARD_FILE, textures
+    ZOOM_STEP, CAMERA_Y_OFFSET, FOV_Y, NEAR_PLANE, FAR_PLANE,
+    SIMULATION_HZ, TARGET_FPS, MAX_FRAME_SKIP,
+    LEADERBOARD_FILE, REPLAY_DIR, RENDERER, CULLING_ENABLED,
+    AUTOPLAY, AUTOPLAY_SPEED, AUTOPLAY_TEXTURES,
+    PROFILER_ENABLED, PROFILER_OVERLAY, PROFILE_DIR
 )
 
 
@@ -51,30 +66,47 @@ def compute_camera_position(azimuth: float, elevation: float, radius: float,
     return cam_x, cam_y, cam_z, tar_x, tar_y, tar_z
 
 
-def update_cube_motion(active: Cube) -> None:
+_saved_position = [0.0, 0.0, 0.0]
+
+
+@contextmanager
+def interpolated_position(cube: Cube, prev_position: List[float], alpha: float):
     """
-    Update active cube position and bounce behavior.
+    Temporarily move a cube between its previous and current tick positions
+    for drawing, restoring the simulated position afterwards.
 
     Parameters:
-        active (Cube): The currently moving cube.
+        cube (Cube): The cube to draw interpolated (normally stack[-1]).
+        prev_position (List[float]): Position at the previous tick.
+        alpha (float): Blend factor, 0 = previous tick, 1 = current tick.
     """
-    step = active.step_distance()
+    position = cube.position
+    _saved_position[:] = position
+    for i in range(3):
+        position[i] = prev_position[i] + (_saved_position[i] - prev_position[i]) * alpha
+    try:
+        yield
+    finally:
+        position[:] = _saved_position
 
-    if active.moving_state == 1:  # forward
-        active.position[0] += active.direction[0]
-        active.position[1] += active.direction[1]
-        active.position[2] += active.direction[2]
-        active.traveled += step
-        if active.traveled >= 2 * active.travel_distance:
-            active.moving_state = 2
 
-    elif active.moving_state == 2:  # backward
-        active.position[0] -= active.direction[0]
-        active.position[1] -= active.direction[1]
-        active.position[2] -= active.direction[2]
-        active.traveled -= step
-        if active.traveled <= 0:
-            active.moving_state = 1
+def release_gl_resources(shader=None, cache=None) -> None:
+    """
+    Delete every GL object the renderers, the HUD and the textures hold in
+    the current context; call before the context is torn down.
+
+    Parameters:
+        shader (Optional[ShaderRenderer]): The game's shader renderer, if any.
+        cache (Optional[StaticStackCache]): The game's stack cache, if any.
+    """
+    if shader:
+        shader.release()
+    if cache:
+        cache.release()
+    release_cube_buffer()
+    release_stream_buffer()
+    release_hud_cache()
+    release_textures()
 
 
 def game_loop(main_menu_callback) -> None:
@@ -84,134 +116,217 @@ def game_loop(main_menu_callback) -> None:
     Parameters:
         on_game_over_callback (function): Called when player loses, with score as argument.
     """
+    if RENDERER == "shader":
+        request_core_profile()
     pygame.display.set_mode(DISPLAY, DOUBLEBUF | OPENGL)
 
     glEnable(GL_DEPTH_TEST)
-    glMatrixMode(GL_PROJECTION)
-    glLoadIdentity()
-    gluPerspective(45.0, SCREEN_WIDTH / SCREEN_HEIGHT, 0.1, 50.0)
-    glMatrixMode(GL_MODELVIEW)
-
-    # Load textures
-    for name, file in textures.items():
-        textures[name] = None
-    for name, file in textures.items():
-        if file is None:
-            textures[name] = load_texture("assets/textures/"+name+".png")
-
-    # Camera
-    azimuth = INITIAL_AZIMUTH
-    elevation = INITIAL_ELEVATION
-    radius = INITIAL_RADIUS
-    dragging = False
-    last_mouse_pos = None
-    vertical_offset = 0.0
-    frame_counter = 0
-
-    # Stack initialization
-    stack = [
-        Cube(
-            position=list(INITIAL_CUBE_POS),
-            rotation=[0.0, 0.0, 0.0],
-            size=list(INITIAL_CUBE_SIZE),
-            moving_state=0
-        )
-    ]
-    spawn_next_cube(stack)
-
-    last_second = time.time()
-    is_running = True
-    while is_running:
-        current_time = time.time()
-        if current_time - last_second >= 1.0:
-            last_second = current_time
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+    if RENDERER != "shader":
+        glMatrixMode(GL_PROJECTION)
+        glLoadIdentity()
+        gluPerspective(FOV_Y, SCREEN_WIDTH / SCREEN_HEIGHT, NEAR_PLANE, FAR_PLANE)
+        glMatrixMode(GL_MODELVIEW)
+
+    # New GL context: HUD glyph atlases must be rebuilt in it, and none of
+    # the cached GL state can be assumed
+    reset_hud_cache()
+    reset_state()
+
+    # Textures (uploaded once per GL context, reused by restarted games)
+    acquire_textures()
+
+    # Stack and HUD renderer (the shader path queues HUD text until flush_text)
+    shader = None
+    cache = None
+    draw_text = draw_hud_text
+    if RENDERER == "shader":
+        shader = ShaderRenderer()
+        draw_stack = shader.draw_stack
+        draw_text = shader.draw_text
+    elif RENDERER == "vbo":
+        init_cube_buffer()
+        draw_stack = draw_stack_vbo
+    elif RENDERER == "batched":
+        reset_stream_buffer()
+        draw_stack = draw_stack_batched
+    elif RENDERER == "cached":
+        init_cube_buffer()
+        cache = StaticStackCache()
+        draw_stack = cache.draw_stack
+    else:
+        draw_stack = draw_stack_immediate
+
+    def drop_cube() -> bool:
+        """Drop the active cube; returns True once a miss has ended the game."""
+        if not sim.drop():
+            prev_position[:] = sim.active.position
+            return False
+        if profiler:
+            profiler.dump(PROFILE_DIR, f"{sim.seed:016x}-{sim.score}",
+                          {"textures": texture_stats(), "gl_state": gl_state_stats()})
+        return True
+
+    scheduler = FixedStepScheduler(SIMULATION_HZ, TARGET_FPS, MAX_FRAME_SKIP)
+    while True:
+        # Camera
+        azimuth = INITIAL_AZIMUTH
+        elevation = INITIAL_ELEVATION
+        radius = INITIAL_RADIUS
+        dragging = False
+        last_mouse_pos = None
+        vertical_offset = 0.0
+
+        # Game state (bot games restart here, in the same GL context)
+        autoplayer = AutoPlayer() if AUTOPLAY else None
+        sim = Simulation(texture_pool=AUTOPLAY_TEXTURES if AUTOPLAY else None)
+        stack = sim.stack
+        prev_position = stack[-1].position[:]
+        if cache:
+            cache.reset()
+
+        # Instrumentation (None when disabled, so each phase costs one test)
+        profiler = FrameProfiler() if PROFILER_ENABLED else None
+        profile_lines = []
+
+        scheduler.reset()
+        while not sim.lost:
+            if profiler:
+                profiler.start_frame()
+
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    release_gl_resources(shader, cache)
+                    pygame.quit()
+                    quit()
+
+                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                    dragging = True
+                    last_mouse_pos = pygame.mouse.get_pos()
+
+                if event.type == pygame.MOUSEBUTTONUP:
+                    if event.button == 1:
+                        dragging = False
+                    elif event.button == 4:
+                        radius = max(2.0, radius - ZOOM_STEP)
+                    elif event.button == 5:
+                        radius = min(50.0, radius + ZOOM_STEP)
+
+                if event.type == pygame.MOUSEMOTION and dragging:
+                    x, y = pygame.mouse.get_pos()
+                    mdx = x - last_mouse_pos[0]
+                    mdy = y - last_mouse_pos[1]
+                    azimuth -= mdx * MOUSE_SENSITIVITY
+                    elevation = max(ELEVATION_MIN, min(ELEVATION_MAX, elevation + mdy * MOUSE_SENSITIVITY))
+                    last_mouse_pos = (x, y)
+
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+                    # One drop per tick: replays hold strictly ascending drop ticks
+                    if sim.drop_ticks and sim.drop_ticks[-1] == sim.tick_count:
+                        continue
+                    if drop_cube():
+                        break
+            if sim.lost:
+                break
+
+            keys = pygame.key.get_pressed()
+            if keys[pygame.K_ESCAPE]:
+                release_gl_resources(shader, cache)
                 pygame.quit()
                 quit()
-
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                dragging = True
-                last_mouse_pos = pygame.mouse.get_pos()
-
-            if event.type == pygame.MOUSEBUTTONUP:
-                if event.button == 1:
-                    dragging = False
-                elif event.button == 4:
-                    radius = max(2.0, radius - ZOOM_STEP)
-                elif event.button == 5:
-                    radius = min(50.0, radius + ZOOM_STEP)
-
-            if event.type == pygame.MOUSEMOTION and dragging:
-                x, y = pygame.mouse.get_pos()
-                mdx = x - last_mouse_pos[0]
-                mdy = y - last_mouse_pos[1]
-                azimuth -= mdx * MOUSE_SENSITIVITY
-                elevation = max(ELEVATION_MIN, min(ELEVATION_MAX, elevation + mdy * MOUSE_SENSITIVITY))
-                last_mouse_pos = (x, y)
-
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-                did_lose = stop_and_spawn(stack)
-                if did_lose:
-                    score = len(stack) - 2
-                    update_leaderboard(score, LEADERBOARD_FILE)
-                    lose_screen(score, restart_callback=game_loop, menu_callback=main_menu_callback)
-                    return
-
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_ESCAPE]:
-            pygame.quit()
-            quit()
-        if keys[pygame.K_w]:
-            vertical_offset += 0.1
-        if keys[pygame.K_s]:
-            vertical_offset -= 0.1
-
-        # Update motion
-        active = stack[-1]
-        if active.moving_state in (1, 2):
-            update_cube_motion(active)
-
-        # Update for special cubes
-        if active.texture_id == "var_a" and frame_counter % 80 == 0:
-            apply_random_acceleration(active, 0.1, 3.0)
-        if active.texture_id == "var_pos" and frame_counter % 80 == 0:
-            teleport_forward(active)
-
-        # Camera focus
-        focus_cube = stack[-2] if len(stack) >= 2 else stack[-1]
-        focus_x = focus_cube.position[0] + focus_cube.size[0] / 2.0
-        focus_y = focus_cube.position[1] + focus_cube.size[1] / 2.0 + vertical_offset
-        focus_z = focus_cube.position[2] + focus_cube.size[2] / 2.0
-
-        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-        glLoadIdentity()
-
-        cam_x, cam_y, cam_z, tar_x, tar_y, tar_z = compute_camera_position(
-            azimuth, elevation, radius, focus_x, focus_y, focus_z, y_lift=CAMERA_Y_OFFSET
-        )
-        gluLookAt(cam_x, cam_y, cam_z, tar_x, tar_y, tar_z, 0, 1, 0)
-
-        # Draw cubes
-        for cube in stack:
-            glPushMatrix()
-            glTranslatef(*cube.position)
-            glRotatef(cube.rotation[0], 1, 0, 0)
-            glRotatef(cube.rotation[1], 0, 1, 0)
-            glRotatef(cube.rotation[2], 0, 0, 1)
-            draw_textured_cuboid(tuple(cube.size), cube.texture_id)
-            glPopMatrix()
-
-        # HUD overlay (score)
-        score = len(stack) - 2
-        draw_hud_text(f"Score: {score}", 20, SCREEN_HEIGHT - 40)
-
-        frame_counter = frame_counter+1
-
-        # Debug area
-        # if active.travel_distance != 0:
-        #     print("travel", active.traveled / active.travel_distance)
-
-        pygame.display.flip()
-        pygame.time.wait(FRAME_DELAY_MS)
+            if profiler:
+                profiler.lap("events")
+
+            # Fixed-rate simulation ticks
+            ticks = scheduler.advance()
+            if autoplayer is not None:
+                ticks *= AUTOPLAY_SPEED
+            for _ in range(ticks):
+                if keys[pygame.K_w]:
+                    vertical_offset += 0.1
+                if keys[pygame.K_s]:
+                    vertical_offset -= 0.1
+
+                if autoplayer is not None and autoplayer.should_drop(sim):
+                    if drop_cube():
+                        break
+                prev_position[:] = sim.active.position
+                if sim.step():
+                    prev_position[:] = sim.active.position  # jump, don't interpolate
+            if sim.lost:
+                break
+            if profiler:
+                profiler.lap("simulate")
+
+            if not scheduler.should_render():
+                if profiler:
+                    profiler.end_frame()
+                continue
+
+            # Camera focus
+            focus_cube = stack[-2] if len(stack) >= 2 else stack[-1]
+            focus_x = focus_cube.position[0] + focus_cube.size[0] / 2.0
+            focus_y = focus_cube.position[1] + focus_cube.size[1] / 2.0 + vertical_offset
+            focus_z = focus_cube.position[2] + focus_cube.size[2] / 2.0
+
+            glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+
+            camera = compute_camera_position(
+                azimuth, elevation, radius, focus_x, focus_y, focus_z, y_lift=CAMERA_Y_OFFSET
+            )
+            if shader:
+                shader.set_camera(camera)
+            else:
+                glLoadIdentity()
+                gluLookAt(*camera, 0, 1, 0)
+
+            # Draw cubes (only the slice of the stack the frustum can reach)
+            window = None
+            if CULLING_ENABLED:
+                y_min, y_max = frustum_y_range(camera, FOV_Y, SCREEN_WIDTH / SCREEN_HEIGHT,
+                                               NEAR_PLANE, FAR_PLANE)
+                window = visible_index_range(len(stack), y_min, y_max)
+            with interpolated_position(sim.active, prev_position, scheduler.alpha):
+                draw_stack(stack, window)
+            if profiler:
+                profiler.lap("render")
+
+            # HUD overlay (score)
+            score = sim.score
+            draw_text(f"Score: {score}", 20, SCREEN_HEIGHT - 40)
+            if profiler and PROFILER_OVERLAY:
+                if profiler.frames % 30 == 0:
+                    resident = texture_stats()
+                    issued, avoided = last_frame()
+                    profile_lines = profiler.overlay_lines() + [
+                        f"textures {resident['resident_textures']} "
+                        f"{resident['resident_bytes'] / 1024:.0f} KiB",
+                        f"gl state {issued} set {avoided} elided"]
+                for i, line in enumerate(profile_lines):
+                    draw_text(line, SCREEN_WIDTH - 470, SCREEN_HEIGHT - 30 - 22 * i, font_size=16)
+            if shader:
+                shader.flush_text()
+            end_gl_frame()
+            if profiler:
+                profiler.lap("hud")
+
+            # Debug area
+            # if active.travel_distance != 0:
+            #     print("travel", active.traveled / active.travel_distance)
+
+            pygame.display.flip()
+            if profiler:
+                profiler.lap("flip")
+            scheduler.wait()
+            if profiler:
+                profiler.lap("wait")
+                profiler.end_frame()
+
+        # Bot games are not recorded; go straight into the next one
+        if autoplayer is None:
+            break
+
+    score = sim.score
+    save_replay(Replay.from_simulation(sim), REPLAY_DIR)
+    update_leaderboard(score, LEADERBOARD_FILE)
+    release_gl_resources(shader, cache)  # the 2D screen replaces the GL context
+    lose_screen(score, restart_callback=game_loop, menu_callback=main_menu_callback)
@@ -1,10 +1,11 @@
 """
-Core gameplay logic: intersection, stopping, trimming, and spawning cubes.
+Core gameplay logic: intersection, motion, stopping, trimming, and spawning cubes.
 """
 
 import math
 import random
 from typing import Optional, Tuple, List
+import numpy as np
 from models import Cube
 from config import SPAWN_RADIUS, STACK_HEIGHT_STEP, ARRIVAL_FRAMES, textures
 
@@ -34,6 +35,39 @@ def intersect_rect(r1: Tuple[float, float, float, float],
     return None
 
 
+def intersect_rect_array(r1: np.ndarray, r2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorised intersect_rect over arrays of rectangles in the XZ plane.
+
+    Rows are intersected pairwise; the inputs broadcast against each other,
+    so one base rectangle can be tested against many candidates. Valid rows
+    are bit-for-bit what intersect_rect returns for the same pair.
+
+    Parameters:
+        r1 (np.ndarray): (..., 4) rows of (x, z, width, depth).
+        r2 (np.ndarray): (..., 4) rows of (x, z, width, depth).
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (overlaps, valid) where overlaps holds
+            (x, z, width, depth) rows as float64 (zeros where there is no
+            overlap) and valid is the boolean mask of rows that overlap.
+    """
+    r1 = np.asarray(r1, dtype=np.float64)
+    r2 = np.asarray(r2, dtype=np.float64)
+    x1, z1, w1, d1 = np.moveaxis(r1, -1, 0)
+    x2, z2, w2, d2 = np.moveaxis(r2, -1, 0)
+
+    left = np.maximum(x1, x2)
+    right = np.minimum(x1 + w1, x2 + w2)
+    back = np.maximum(z1, z2)
+    front = np.minimum(z1 + d1, z2 + d2)
+
+    valid = (left < right) & (back < front)
+    overlaps = np.stack((left, back, right - left, front - back), axis=-1)
+    overlaps[~valid] = 0.0
+    return overlaps, valid
+
+
 def trim_or_lose(stack: List[Cube]) -> bool:
     """
     Trim the top moving cube based on intersection with the previous cube.
@@ -66,26 +100,60 @@ def trim_or_lose(stack: List[Cube]) -> bool:
     return False
 
 
-def spawn_next_cube(stack: List[Cube]) -> None:
+def update_cube_motion(active: Cube) -> None:
+    """
+    Update active cube position and bounce behavior.
+
+    Parameters:
+        active (Cube): The currently moving cube.
+    """
+    step = active.step_distance()
+
+    if active.moving_state == 1:  # forward
+        active.position[0] += active.direction[0]
+        active.position[1] += active.direction[1]
+        active.position[2] += active.direction[2]
+        active.traveled += step
+        if active.traveled >= 2 * active.travel_distance:
+            active.moving_state = 2
+
+    elif active.moving_state == 2:  # backward
+        active.position[0] -= active.direction[0]
+        active.position[1] -= active.direction[1]
+        active.position[2] -= active.direction[2]
+        active.traveled -= step
+        if active.traveled <= 0:
+            active.moving_state = 1
+
+
+def spawn_next_cube(stack: List[Cube], rng=random,
+                    spawn_radius: float = SPAWN_RADIUS,
+                    arrival_frames: float = ARRIVAL_FRAMES,
+                    texture_pool: Optional[List[str]] = None) -> None:
     """
     Spawn a new moving cube around the target position of the last cube.
 
     Parameters:
         stack (List[Cube]): Current stack of cubes.
+        rng: Random source (random.Random or the random module).
+        spawn_radius (float): Distance from the target to the spawn point.
+        arrival_frames (float): Ticks the cube takes to reach the target.
+        texture_pool (Optional[List[str]]): Texture names drawn from
+            uniformly; repeat a name to weight it. Defaults to every texture.
     """
     base = stack[-1]
     target_x, target_z = base.position[0], base.position[2]
 
-    angle = random.uniform(-math.pi, math.pi)
-    spawn_x = target_x + SPAWN_RADIUS * math.cos(angle)
-    spawn_z = target_z + SPAWN_RADIUS * math.sin(angle)
+    angle = rng.uniform(-math.pi, math.pi)
+    spawn_x = target_x + spawn_radius * math.cos(angle)
+    spawn_z = target_z + spawn_radius * math.sin(angle)
     spawn_y = base.position[1] + STACK_HEIGHT_STEP
 
     dx = target_x - spawn_x
     dz = target_z - spawn_z
-    direction = [dx / ARRIVAL_FRAMES, 0.0, dz / ARRIVAL_FRAMES]
+    direction = [dx / arrival_frames, 0.0, dz / arrival_frames]
     travel_distance = math.sqrt(dx**2 + dz**2)
-    texture_choice = random.choice(list(textures))
+    texture_choice = rng.choice(texture_pool if texture_pool is not None else list(textures))
 
     new_cube = Cube(
         position=[spawn_x, spawn_y, spawn_z],
@@ -102,12 +170,15 @@ def spawn_next_cube(stack: List[Cube]) -> None:
     stack.append(new_cube)
 
 
-def stop_and_spawn(stack: List[Cube]) -> bool:
+def stop_and_spawn(stack: List[Cube], rng=random,
+                   texture_pool: Optional[List[str]] = None) -> bool:
     """
     Stop the current moving cube, apply trimming, and spawn the next cube.
 
     Parameters:
         stack (List[Cube]): Current stack of cubes.
+        rng: Random source (random.Random or the random module).
+        texture_pool (Optional[List[str]]): Passed on to spawn_next_cube.
 
     Returns:
         bool: True if player loses (no overlap), False otherwise.
@@ -115,5 +186,5 @@ def stop_and_spawn(stack: List[Cube]) -> bool:
     stack[-1].moving_state = 0
     did_lose = trim_or_lose(stack)
     if not did_lose:
-        spawn_next_cube(stack)
+        spawn_next_cube(stack, rng, texture_pool=texture_pool)
     return did_lose
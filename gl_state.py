@@ -0,0 +1,197 @@
+"""
+Shadow copy of the GL state the renderers and the HUD set every frame:
+capabilities, client arrays, texture, buffer and vertex array bindings,
+texture environment, current colour, blend function and matrix mode.
+
+Each setter reaches GL only when the value actually changes, and counts
+the calls it skips, so the savings show up in the profiler overlay and
+dumps. Drawing code sets every cached value it depends on and leaves it
+as is afterwards; the next draw changes only what differs.
+
+The cache must see every change to the state it covers: go through this
+module (deleting textures and buffers included) and call reset_state()
+whenever a GL context is created.
+"""
+
+from typing import Dict, Iterable, Tuple
+from OpenGL.GL import *
+
+
+_UNSET = object()
+
+
+class GLStateCache:
+    """
+    Last value set for each piece of cached GL state.
+
+    Attributes:
+        issued (int): State calls passed on to GL in the current frame.
+        avoided (int): Redundant state calls skipped in the current frame.
+        last_frame (Tuple[int, int]): (issued, avoided) of the last
+            finished frame.
+        frames (int): Frames finished with end_frame().
+        total_issued (int): State calls passed on over all finished frames.
+        total_avoided (int): State calls skipped over all finished frames.
+    """
+
+    def __init__(self):
+        self._state: Dict[Tuple, object] = {}
+        self.issued = 0
+        self.avoided = 0
+        self.last_frame = (0, 0)
+        self.frames = 0
+        self.total_issued = 0
+        self.total_avoided = 0
+
+    def reset(self) -> None:
+        """Forget every cached value, so the next set of each is issued."""
+        self._state.clear()
+
+    def _changed(self, key: Tuple, value) -> bool:
+        if self._state.get(key, _UNSET) == value:
+            self.avoided += 1
+            return False
+        self._state[key] = value
+        self.issued += 1
+        return True
+
+    def enable(self, cap: int) -> None:
+        """glEnable(cap) unless already enabled."""
+        if self._changed(("cap", cap), True):
+            glEnable(cap)
+
+    def disable(self, cap: int) -> None:
+        """glDisable(cap) unless already disabled."""
+        if self._changed(("cap", cap), False):
+            glDisable(cap)
+
+    def enable_client_state(self, array: int) -> None:
+        """glEnableClientState(array) unless already enabled."""
+        if self._changed(("client", array), True):
+            glEnableClientState(array)
+
+    def disable_client_state(self, array: int) -> None:
+        """glDisableClientState(array) unless already disabled."""
+        if self._changed(("client", array), False):
+            glDisableClientState(array)
+
+    def bind_texture(self, target: int, texture: int) -> None:
+        """glBindTexture unless texture is already bound to target."""
+        if self._changed(("texture", target), texture):
+            glBindTexture(target, texture)
+
+    def bind_buffer(self, target: int, buffer: int) -> None:
+        """glBindBuffer unless buffer is already bound to target."""
+        if self._changed(("buffer", target), buffer):
+            glBindBuffer(target, buffer)
+
+    def bind_vertex_array(self, vao: int) -> None:
+        """glBindVertexArray unless vao is already bound."""
+        if self._changed(("vertex_array",), vao):
+            glBindVertexArray(vao)
+
+    def tex_env_mode(self, mode: int) -> None:
+        """Set GL_TEXTURE_ENV_MODE unless it already is mode."""
+        if self._changed(("tex_env_mode",), mode):
+            glTexEnvf(GL_TEXTURE_ENV, GL_TEXTURE_ENV_MODE, mode)
+
+    def color(self, r: float, g: float, b: float, a: float = 1.0) -> None:
+        """glColor4f unless the current colour already is (r, g, b, a)."""
+        if self._changed(("color",), (r, g, b, a)):
+            glColor4f(r, g, b, a)
+
+    def blend_func(self, src: int, dst: int) -> None:
+        """glBlendFunc unless the factors are already (src, dst)."""
+        if self._changed(("blend_func",), (src, dst)):
+            glBlendFunc(src, dst)
+
+    def matrix_mode(self, mode: int) -> None:
+        """glMatrixMode unless mode is already current."""
+        if self._changed(("matrix_mode",), mode):
+            glMatrixMode(mode)
+
+    def delete_textures(self, textures: Iterable[int]) -> None:
+        """
+        glDeleteTextures, and forget bindings of the deleted names (GL
+        unbinds them, and the names may be handed out again).
+        """
+        textures = list(textures)
+        glDeleteTextures(textures)
+        self._forget("texture", textures)
+
+    def delete_buffers(self, buffers: Iterable[int]) -> None:
+        """glDeleteBuffers, and forget bindings of the deleted names."""
+        buffers = list(buffers)
+        glDeleteBuffers(len(buffers), buffers)
+        self._forget("buffer", buffers)
+
+    def delete_vertex_arrays(self, arrays: Iterable[int]) -> None:
+        """glDeleteVertexArrays, and forget the binding if it was one of them."""
+        arrays = list(arrays)
+        glDeleteVertexArrays(len(arrays), arrays)
+        self._forget("vertex_array", arrays)
+
+    def _forget(self, kind: str, names) -> None:
+        for key, value in list(self._state.items()):
+            if key[0] == kind and value in names:
+                del self._state[key]
+
+    def end_frame(self) -> Tuple[int, int]:
+        """
+        Close the current frame's counters.
+
+        Returns:
+            Tuple[int, int]: (issued, avoided) state calls of the frame.
+        """
+        self.last_frame = (self.issued, self.avoided)
+        self.frames += 1
+        self.total_issued += self.issued
+        self.total_avoided += self.avoided
+        self.issued = self.avoided = 0
+        return self.last_frame
+
+    def stats(self) -> Dict[str, float]:
+        """Counters for instrumentation."""
+        frames = max(self.frames, 1)
+        return {
+            "frames": self.frames,
+            "issued": self.total_issued,
+            "avoided": self.total_avoided,
+            "issued_per_frame": self.total_issued / frames,
+            "avoided_per_frame": self.total_avoided / frames,
+        }
+
+
+_cache = GLStateCache()
+
+# Module-level setters, bound once so a call costs no more than a method call
+enable = _cache.enable
+disable = _cache.disable
+enable_client_state = _cache.enable_client_state
+disable_client_state = _cache.disable_client_state
+bind_texture = _cache.bind_texture
+bind_buffer = _cache.bind_buffer
+bind_vertex_array = _cache.bind_vertex_array
+tex_env_mode = _cache.tex_env_mode
+color = _cache.color
+blend_func = _cache.blend_func
+matrix_mode = _cache.matrix_mode
+delete_textures = _cache.delete_textures
+delete_buffers = _cache.delete_buffers
+delete_vertex_arrays = _cache.delete_vertex_arrays
+end_frame = _cache.end_frame
+
+
+def reset_state() -> None:
+    """Forget the cached state; call when a new GL context is created."""
+    _cache.reset()
+
+
+def last_frame() -> Tuple[int, int]:
+    """(issued, avoided) state calls of the last finished frame."""
+    return _cache.last_frame
+
+
+def gl_state_stats() -> Dict[str, float]:
+    """Issued and avoided state calls, in total and per frame."""
+    return _cache.stats()
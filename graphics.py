@@ -5,7 +5,45 @@ OpenGL rendering helpers: texture loading and cube drawing.
 import pygame
 from OpenGL.GL import *
 from OpenGL.GLU import *
-from config import textures
+import gl_state
+from cube_stack import TEXTURE_NAMES, TEXTURE_INDEX
+from config import texture_atlas
+
+
+# Unit cube corners per face (scaled by the cuboid size when drawn)
+CUBE_FACES = [
+    [(0,0,0), (1,0,0), (1,1,0), (0,1,0)],  # Back
+    [(0,0,1), (1,0,1), (1,1,1), (0,1,1)],  # Front
+    [(0,0,0), (1,0,0), (1,0,1), (0,0,1)],  # Bottom
+    [(0,1,0), (1,1,0), (1,1,1), (0,1,1)],  # Top
+    [(1,0,0), (1,1,0), (1,1,1), (1,0,1)],  # Right
+    [(0,0,0), (0,1,0), (0,1,1), (0,0,1)],  # Left
+]
+CUBE_TEX_COORDS = [(0,0), (1,0), (1,1), (0,1)]
+
+# The cube textures are stacked bottom to top in one atlas, one tile per
+# entry of config.textures. Tile UVs stay half a texel of the smallest mip
+# level sampled (ATLAS_MAX_LEVEL of a 512 px tile) inside their tile, so
+# filtering never reads the neighbouring one at any level; the atlas wraps
+# with GL_CLAMP_TO_EDGE so the top tile does not blend into the bottom one.
+ATLAS_TILES = len(TEXTURE_NAMES)
+ATLAS_TILE_SIZE = 512
+ATLAS_MAX_LEVEL = 4
+TILE_INSET = 0.5 * 2 ** ATLAS_MAX_LEVEL / ATLAS_TILE_SIZE
+
+
+def atlas_v(v, tile):
+    """
+    Map a per-texture v coordinate into the atlas.
+
+    Parameters:
+        v (float | np.ndarray): Coordinate in [0, 1] within the texture.
+        tile (int | np.ndarray): Tile index (TEXTURE_INDEX of the texture).
+
+    Returns:
+        float | np.ndarray: Coordinate in the atlas.
+    """
+    return (tile + TILE_INSET + v * (1.0 - 2.0 * TILE_INSET)) / ATLAS_TILES
 
 
 def load_texture(path: str) -> int:
@@ -13,45 +51,75 @@ def load_texture(path: str) -> int:
     surface = pygame.image.load(path)
     texture_data = pygame.image.tostring(surface, "RGB", True)
     width, height = surface.get_size()
+    return upload_texture(texture_data, width, height)
+
 
-    glEnable(GL_TEXTURE_2D)
+def upload_texture(texture_data: bytes, width: int, height: int) -> int:
+    """Upload decoded RGB pixels (rows bottom-up) as a new OpenGL texture."""
     texture_id = glGenTextures(1)
-    glBindTexture(GL_TEXTURE_2D, texture_id)
+    gl_state.bind_texture(GL_TEXTURE_2D, texture_id)
     glTexImage2D(GL_TEXTURE_2D, 0, GL_RGB, width, height, 0,
                  GL_RGB, GL_UNSIGNED_BYTE, texture_data)
     glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
     glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
     return texture_id
 
 
-def draw_textured_cuboid(size, texture_id: str) -> None:
-    """Draw a textured cuboid at the origin with given size."""
-    width, height, depth = size
+def begin_atlas() -> None:
+    """
+    Set the state for opaque drawing from the cube atlas, for any number of
+    cubes. Only values that differ from the current GL state are sent.
+    """
+    gl_state.enable(GL_TEXTURE_2D)
+    gl_state.disable(GL_BLEND)
+    gl_state.bind_texture(GL_TEXTURE_2D, texture_atlas["id"])
+    gl_state.tex_env_mode(GL_MODULATE)
+    gl_state.color(1, 1, 1)
+
 
-    glEnable(GL_TEXTURE_2D)
-    glBindTexture(GL_TEXTURE_2D, textures[texture_id])
-    # print("draw", textures[texture_id])
-    glTexEnvf(GL_TEXTURE_ENV, GL_TEXTURE_ENV_MODE, GL_MODULATE)
-    glColor3f(1, 1, 1)
+def emit_cuboid(size, texture_id: str) -> None:
+    """Emit the quads of a cuboid at the origin; texturing must be set up."""
+    width, height, depth = size
+    tile = TEXTURE_INDEX[texture_id]
 
     glBegin(GL_QUADS)
 
     def v(p): return (p[0] * width, p[1] * height, p[2] * depth)
 
-    faces = [
-        [v((0,0,0)), v((1,0,0)), v((1,1,0)), v((0,1,0))],  # Back
-        [v((0,0,1)), v((1,0,1)), v((1,1,1)), v((0,1,1))],  # Front
-        [v((0,0,0)), v((1,0,0)), v((1,0,1)), v((0,0,1))],  # Bottom
-        [v((0,1,0)), v((1,1,0)), v((1,1,1)), v((0,1,1))],  # Top
-        [v((1,0,0)), v((1,1,0)), v((1,1,1)), v((1,0,1))],  # Right
-        [v((0,0,0)), v((0,1,0)), v((0,1,1)), v((0,0,1))],  # Left
-    ]
-
-    tex = [(0,0), (1,0), (1,1), (0,1)]
-    for face in faces:
+    for face in CUBE_FACES:
         for i in range(4):
-            glTexCoord2fv(tex[i])
-            glVertex3fv(face[i])
+            u, tv = CUBE_TEX_COORDS[i]
+            glTexCoord2f(u, atlas_v(tv, tile))
+            glVertex3fv(v(face[i]))
     glEnd()
 
-    glDisable(GL_TEXTURE_2D)
+
+def draw_textured_cuboid(size, texture_id: str) -> None:
+    """Draw a textured cuboid at the origin with given size."""
+    begin_atlas()
+    emit_cuboid(size, texture_id)
+
+
+def draw_stack(stack, window=None) -> None:
+    """
+    Draw every cube of the stack in immediate mode, with texturing set up
+    once for the whole stack.
+
+    Parameters:
+        stack (List[Cube]): Cubes to draw, bottom to top.
+        window (Optional[Tuple[int, int]]): Half-open index range to draw;
+            the whole stack when None.
+    """
+    lo, hi = window if window is not None else (0, len(stack))
+    begin_atlas()
+    for i in range(lo, hi):
+        cube = stack[i]
+        glPushMatrix()
+        glTranslatef(*cube.position)
+        glRotatef(cube.rotation[0], 1, 0, 0)
+        glRotatef(cube.rotation[1], 0, 1, 0)
+        glRotatef(cube.rotation[2], 0, 0, 1)
+        emit_cuboid(cube.size, cube.texture_id)
+        glPopMatrix()
@@ -1,11 +1,116 @@
 """
 HUD overlay for displaying score using OpenGL texture quads.
+
+Text is drawn from a per-size glyph atlas that is rasterised and uploaded
+once per GL context; drawing a string only streams its quads.
 """
 
+import numpy as np
 import pygame
 from OpenGL.GL import *
 from OpenGL.GLU import *
-from config import FONT_PATH, SCREEN_WIDTH, SCREEN_HEIGHT
+import gl_state
+from ui import get_font
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+ATLAS_CHARS = "".join(chr(c) for c in range(32, 127))
+ATLAS_WIDTH = 512
+GLYPH_PADDING = 1
+
+_atlases = {}
+
+
+class GlyphAtlas:
+    """
+    One RGBA texture holding every printable ASCII glyph of a font size,
+    rendered white so the colour can be applied with GL_MODULATE.
+
+    Attributes:
+        texture_id (int): GL texture holding the atlas.
+        glyphs (dict): char -> (u0, v0, u1, v1, width, height).
+    """
+
+    def __init__(self, font_size: int):
+        font = get_font(font_size)
+        rendered = {ch: font.render(ch, True, (255, 255, 255)) for ch in ATLAS_CHARS}
+
+        # Shelf-pack glyphs left to right, wrapping at ATLAS_WIDTH
+        placements = {}
+        x = y = row_h = 0
+        for ch, surf in rendered.items():
+            w, h = surf.get_size()
+            if x + w + GLYPH_PADDING > ATLAS_WIDTH:
+                x, y, row_h = 0, y + row_h + GLYPH_PADDING, 0
+            placements[ch] = (x, y)
+            x += w + GLYPH_PADDING
+            row_h = max(row_h, h)
+        atlas_h = y + row_h
+
+        atlas = pygame.Surface((ATLAS_WIDTH, atlas_h), pygame.SRCALPHA)
+        atlas.fill((255, 255, 255, 0))
+        self.glyphs = {}
+        for ch, surf in rendered.items():
+            gx, gy = placements[ch]
+            w, h = surf.get_size()
+            atlas.blit(surf, (gx, gy), special_flags=pygame.BLEND_RGBA_MAX)
+            # Texture rows are flipped on upload, so v runs bottom-up
+            self.glyphs[ch] = (gx / ATLAS_WIDTH, 1.0 - (gy + h) / atlas_h,
+                               (gx + w) / ATLAS_WIDTH, 1.0 - gy / atlas_h, w, h)
+
+        texture_data = pygame.image.tostring(atlas, "RGBA", True)
+        self.texture_id = glGenTextures(1)
+        gl_state.bind_texture(GL_TEXTURE_2D, self.texture_id)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, ATLAS_WIDTH, atlas_h, 0,
+                     GL_RGBA, GL_UNSIGNED_BYTE, texture_data)
+        glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+        glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+
+    def build_quads(self, text: str, x: float, y: float) -> np.ndarray:
+        """
+        Lay out a string as textured quads starting at (x, y), bottom-left.
+
+        Returns:
+            np.ndarray: (4 * len(text), 4) float32 rows of [u, v, x, y].
+        """
+        quads = np.empty((len(text) * 4, 4), dtype=np.float32)
+        n = 0
+        for ch in text:
+            glyph = self.glyphs.get(ch)
+            if glyph is None:
+                glyph = self.glyphs["?"]
+            u0, v0, u1, v1, w, h = glyph
+            quads[n:n + 4] = ((u0, v0, x, y), (u1, v0, x + w, y),
+                              (u1, v1, x + w, y + h), (u0, v1, x, y + h))
+            n += 4
+            x += w
+        return quads[:n]
+
+
+def get_atlas(font_size: int) -> GlyphAtlas:
+    """Return the glyph atlas for a size, building it on first use."""
+    atlas = _atlases.get(font_size)
+    if atlas is None:
+        atlas = _atlases[font_size] = GlyphAtlas(font_size)
+    return atlas
+
+
+def reset_hud_cache() -> None:
+    """
+    Forget atlas textures; call when a new GL context is created. Atlases
+    still live in the current context (it was kept) are deleted, not leaked.
+    """
+    live = [atlas.texture_id for atlas in _atlases.values() if glIsTexture(atlas.texture_id)]
+    if live:
+        gl_state.delete_textures(live)
+    _atlases.clear()
+
+
+def release_hud_cache() -> None:
+    """Delete every atlas texture; call before the GL context is torn down."""
+    if _atlases:
+        gl_state.delete_textures([atlas.texture_id for atlas in _atlases.values()])
+    _atlases.clear()
 
 
 def render_text_texture(text: str, font_size: int = 28, color=(255, 255, 255)):
@@ -15,13 +120,13 @@ def render_text_texture(text: str, font_size: int = 28, color=(255, 255, 255)):
     Returns:
         tuple: (texture_id, width, height)
     """
-    font = pygame.font.Font(FONT_PATH, font_size)
+    font = get_font(font_size)
     surface = font.render(text, True, color)
     texture_data = pygame.image.tostring(surface, "RGBA", True)
     width, height = surface.get_size()
 
     tex_id = glGenTextures(1)
-    glBindTexture(GL_TEXTURE_2D, tex_id)
+    gl_state.bind_texture(GL_TEXTURE_2D, tex_id)
     glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, width, height, 0,
                  GL_RGBA, GL_UNSIGNED_BYTE, texture_data)
     glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
@@ -31,51 +136,40 @@ def render_text_texture(text: str, font_size: int = 28, color=(255, 255, 255)):
 
 
 def draw_hud_text(text: str, x: int, y: int, font_size: int = 28):
-    font = pygame.font.Font(FONT_PATH, font_size)
-    surface = font.render(text, True, (255, 255, 255))
-    surface = surface.convert_alpha()
-
-    texture_data = pygame.image.tostring(surface, "RGBA", True)
-    w, h = surface.get_size()
-
-    tex_id = glGenTextures(1)
-    glBindTexture(GL_TEXTURE_2D, tex_id)
-    glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, w, h, 0,
-                 GL_RGBA, GL_UNSIGNED_BYTE, texture_data)
-    glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-    glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+    atlas = get_atlas(font_size)
+    quads = atlas.build_quads(text, x, y)
+    if not len(quads):
+        return
 
     # Switch to orthographic projection
-    glMatrixMode(GL_PROJECTION)
+    gl_state.matrix_mode(GL_PROJECTION)
     glPushMatrix()
     glLoadIdentity()
     gluOrtho2D(0, SCREEN_WIDTH, 0, SCREEN_HEIGHT)
 
-    glMatrixMode(GL_MODELVIEW)
+    gl_state.matrix_mode(GL_MODELVIEW)
     glPushMatrix()
     glLoadIdentity()
 
-    glEnable(GL_TEXTURE_2D)
-    glEnable(GL_BLEND)
-    glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-    glBindTexture(GL_TEXTURE_2D, tex_id)
-    glTexEnvf(GL_TEXTURE_ENV, GL_TEXTURE_ENV_MODE, GL_MODULATE)
-    glColor4f(1, 1, 1, 1)
-
-    glBegin(GL_QUADS)
-    glTexCoord2f(0, 0); glVertex2f(x, y)
-    glTexCoord2f(1, 0); glVertex2f(x + w, y)
-    glTexCoord2f(1, 1); glVertex2f(x + w, y + h)
-    glTexCoord2f(0, 1); glVertex2f(x, y + h)
-    glEnd()
-
-    glDisable(GL_TEXTURE_2D)
-    glDisable(GL_BLEND)
+    # Blended glyphs; state the cubes share with the HUD is not re-sent
+    gl_state.enable(GL_TEXTURE_2D)
+    gl_state.enable(GL_BLEND)
+    gl_state.blend_func(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+    gl_state.bind_texture(GL_TEXTURE_2D, atlas.texture_id)
+    gl_state.tex_env_mode(GL_MODULATE)
+    gl_state.color(1, 1, 1, 1)
+
+    # Client-side arrays: the whole string is one draw call
+    gl_state.bind_buffer(GL_ARRAY_BUFFER, 0)
+    gl_state.enable_client_state(GL_TEXTURE_COORD_ARRAY)
+    gl_state.enable_client_state(GL_VERTEX_ARRAY)
+    tex_coords = np.ascontiguousarray(quads[:, :2])
+    vertices = np.ascontiguousarray(quads[:, 2:])
+    glTexCoordPointer(2, GL_FLOAT, 0, tex_coords)
+    glVertexPointer(2, GL_FLOAT, 0, vertices)
+    glDrawArrays(GL_QUADS, 0, len(quads))
 
     glPopMatrix()
-    glMatrixMode(GL_PROJECTION)
+    gl_state.matrix_mode(GL_PROJECTION)
     glPopMatrix()
-    glMatrixMode(GL_MODELVIEW)
-
-    # Optionally delete texture at end of frame, not before swap
-    glDeleteTextures([tex_id])
+    gl_state.matrix_mode(GL_MODELVIEW)
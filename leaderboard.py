@@ -2,10 +2,17 @@
 Leaderboard file I/O and display screen.
 """
 
+import atexit
+import os
+import time
+from bisect import insort
 import pygame
-from typing import List
-from ui import draw_text
-from config import DISPLAY, SCREEN_WIDTH, SCREEN_HEIGHT, LEADERBOARD_FILE, MAX_DISPLAY_SCORES
+from typing import Dict, List
+from ui import draw_text, wait_for_events
+from config import (
+    DISPLAY, SCREEN_WIDTH, SCREEN_HEIGHT, LEADERBOARD_FILE,
+    MAX_DISPLAY_SCORES, MAX_STORED_SCORES, LEADERBOARD_FLUSH_INTERVAL
+)
 
 
 def read_leaderboard(filename: str = LEADERBOARD_FILE) -> List[int]:
@@ -34,33 +41,114 @@ def read_leaderboard(filename: str = LEADERBOARD_FILE) -> List[int]:
     return scores
 
 
-def write_leaderboard(scores: List[int], filename: str = LEADERBOARD_FILE) -> None:
+class LeaderboardStore:
     """
-    Write leaderboard scores to file.
+    Leaderboard held in memory: the file is read once, scores are kept sorted
+    as they arrive, and changes are written behind, at most once per
+    flush_interval and at exit, with an atomic rename.
 
-    Parameters:
-        scores (List[int]): Scores to write (will be truncated/padded).
+    Scores are stored negated in ascending order so bisect keeps the list
+    best-first and dropping the worst retained score is a pop from the end.
+
+    Attributes:
         filename (str): Path to leaderboard file.
+        capacity (int): Most scores retained (and written back).
+        flush_interval (float): Seconds changes may stay pending before
+            flush_if_due() writes them.
+        dirty (bool): True when memory holds changes not yet on disk.
     """
-    with open(filename, "w") as f:
-        f.write((str(MAX_DISPLAY_SCORES) + "\n"))
-        for i in range(MAX_DISPLAY_SCORES):
-            s = scores[i] if i < len(scores) else 0
-            f.write(str(s) + "\n")
+
+    def __init__(self, filename: str = LEADERBOARD_FILE, capacity: int = MAX_STORED_SCORES,
+                 flush_interval: float = LEADERBOARD_FLUSH_INTERVAL, clock=time.monotonic):
+        self.filename = filename
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.dirty = False
+        self._clock = clock
+        self._flushed_at = clock()
+        self._negated = sorted(-s for s in read_leaderboard(filename))[:capacity]
+
+    def __len__(self) -> int:
+        return len(self._negated)
+
+    def add(self, score: int) -> bool:
+        """
+        Insert a score in order.
+
+        Returns:
+            bool: True if the retained scores changed (and need flushing),
+                False if the store is full and the score ranks below all of them.
+        """
+        if len(self._negated) >= self.capacity and -score >= self._negated[-1]:
+            return False
+        insort(self._negated, -score)
+        if len(self._negated) > self.capacity:
+            self._negated.pop()
+        self.dirty = True
+        return True
+
+    def top(self, n: int = MAX_DISPLAY_SCORES) -> List[int]:
+        """Return the n best scores, highest first."""
+        return [-s for s in self._negated[:n]]
+
+    def flush(self) -> None:
+        """
+        Write pending changes next to the leaderboard file and rename it into
+        place, so a crash never leaves a half-written file.
+        """
+        if not self.dirty:
+            return
+        tmp_path = self.filename + ".tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                f.write(str(len(self._negated)) + "\n")
+                f.writelines(str(-s) + "\n" for s in self._negated)
+            os.replace(tmp_path, self.filename)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass    # open() itself failed; keep its error
+            raise
+        self.dirty = False
+        self._flushed_at = self._clock()
+
+    def flush_if_due(self) -> None:
+        """Flush pending changes if flush_interval has passed since the last write."""
+        if self.dirty and self._clock() - self._flushed_at >= self.flush_interval:
+            self.flush()
+
+
+_stores: Dict[str, LeaderboardStore] = {}
+
+
+def get_store(filename: str = LEADERBOARD_FILE) -> LeaderboardStore:
+    """Return the shared store for a leaderboard file, loading it on first use."""
+    store = _stores.get(filename)
+    if store is None:
+        store = _stores[filename] = LeaderboardStore(filename)
+    return store
+
+
+@atexit.register
+def flush_all() -> None:
+    """Write back every store with pending changes."""
+    for store in _stores.values():
+        store.flush()
 
 
 def update_leaderboard(new_score: int, filename: str = LEADERBOARD_FILE) -> None:
     """
-    Add a new score to leaderboard and persist it.
+    Add a new score to leaderboard. It is written behind: with the next
+    flush once the store's flush interval has passed, and at exit.
 
     Parameters:
         new_score (int): Player score to add.
         filename (str): Path to leaderboard file.
     """
-    scores = read_leaderboard(filename)
-    scores.append(new_score)
-    scores = sorted(scores, reverse=True)
-    write_leaderboard(scores, filename)
+    store = get_store(filename)
+    store.add(new_score)
+    store.flush_if_due()
 
 
 def show_leaderboard() -> None:
@@ -68,32 +156,35 @@ def show_leaderboard() -> None:
     Display the local leaderboard screen.
     """
     screen = pygame.display.set_mode(DISPLAY)
+    scores = get_store().top(5)
     is_running = True
+    needs_redraw = True
 
     while is_running:
-        screen.fill((0, 0, 0))
-        draw_text(screen, "Local Leaderboard",
-                  (SCREEN_WIDTH//4-100, SCREEN_HEIGHT//4-50,
-                   SCREEN_WIDTH//2+200, SCREEN_HEIGHT//4),
-                  size=32, align="center")
-        draw_text(screen, "Press ESC to return",
-                  (SCREEN_WIDTH//2-200, SCREEN_HEIGHT//4,
-                   SCREEN_WIDTH//2+200, SCREEN_HEIGHT//4+50),
-                  size=28, align="center")
-
-        scores = read_leaderboard()
-        # print(scores)
-        for i, s in enumerate(sorted(scores, reverse=True)[:5], start=1):
-            draw_text(screen, f"{i}. {s}",
-                      (SCREEN_WIDTH//2-200, SCREEN_HEIGHT//4+i*50+50,
-                       SCREEN_WIDTH//2+200, SCREEN_HEIGHT//4+i*50+100),
+        if needs_redraw:
+            screen.fill((0, 0, 0))
+            draw_text(screen, "Local Leaderboard",
+                      (SCREEN_WIDTH//4-100, SCREEN_HEIGHT//4-50,
+                       SCREEN_WIDTH//2+200, SCREEN_HEIGHT//4),
                       size=32, align="center")
-
-        for event in pygame.event.get():
+            draw_text(screen, "Press ESC to return",
+                      (SCREEN_WIDTH//2-200, SCREEN_HEIGHT//4,
+                       SCREEN_WIDTH//2+200, SCREEN_HEIGHT//4+50),
+                      size=28, align="center")
+
+            # print(scores)
+            for i, s in enumerate(scores, start=1):
+                draw_text(screen, f"{i}. {s}",
+                          (SCREEN_WIDTH//2-200, SCREEN_HEIGHT//4+i*50+50,
+                           SCREEN_WIDTH//2+200, SCREEN_HEIGHT//4+i*50+100),
+                          size=32, align="center")
+            pygame.display.flip()
+
+        events = wait_for_events()
+        needs_redraw = bool(events)
+        for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 quit()
             if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                 is_running = False
-
-        pygame.display.flip()
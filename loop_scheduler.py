@@ -0,0 +1,97 @@
+"""
+Frame scheduling: fixed-timestep simulation decoupled from the render rate.
+"""
+
+import time
+
+
+class FixedStepScheduler:
+    """
+    Drives a loop that simulates at a fixed tick rate and renders at up to a
+    target frame rate.
+
+    Each frame, advance() reports how many simulation ticks are due from the
+    real time elapsed, alpha gives how far the clock is between the last tick
+    and the next one (for interpolating positions), should_render() says
+    whether to draw this frame, and wait() sleeps off any time left before
+    the next frame is due.
+
+    Attributes:
+        tick_rate (float): Simulation ticks per second.
+        target_fps (float): Frames rendered per second at most.
+        max_frame_skip (int): Consecutive frames that may go undrawn while
+            the loop is catching up.
+        max_frame_time (float): Longest real interval credited to the
+            simulation in one frame, in seconds; stalls beyond it (window
+            drags, breakpoints) are dropped rather than replayed.
+    """
+
+    def __init__(self, tick_rate: float, target_fps: float,
+                 max_frame_skip: int = 5, max_frame_time: float = 0.25,
+                 clock=time.perf_counter, sleep=time.sleep):
+        self.tick_rate = tick_rate
+        self.target_fps = target_fps
+        self.max_frame_skip = max_frame_skip
+        self.max_frame_time = max_frame_time
+        self.tick_dt = 1.0 / tick_rate
+        self.frame_dt = 1.0 / target_fps
+        self._clock = clock
+        self._sleep = sleep
+        self.reset()
+
+    def reset(self) -> None:
+        """Restart timing from now, e.g. after a pause or a blocking screen."""
+        now = self._clock()
+        self._last_time = now
+        self._next_frame = now
+        self._accumulator = 0.0
+        self._skipped = 0
+        self.ticks = 0
+        self.frames_rendered = 0
+        self.frames_skipped = 0
+
+    def advance(self) -> int:
+        """
+        Account for the real time elapsed since the previous call.
+
+        Returns:
+            int: Number of simulation ticks to run this frame.
+        """
+        now = self._clock()
+        elapsed = min(now - self._last_time, self.max_frame_time)
+        self._last_time = now
+        self._accumulator += elapsed
+        due = int(self._accumulator / self.tick_dt)
+        self._accumulator -= due * self.tick_dt
+        self.ticks += due
+        return due
+
+    @property
+    def alpha(self) -> float:
+        """Fraction of a tick elapsed since the last simulated tick, in [0, 1)."""
+        return self._accumulator / self.tick_dt
+
+    def should_render(self) -> bool:
+        """
+        Decide whether to draw this frame. Frames are skipped only while the
+        loop is more than a whole frame behind schedule, and never more than
+        max_frame_skip in a row; simulation ticks are never skipped.
+        """
+        self._next_frame += self.frame_dt
+        behind = self._clock() > self._next_frame
+        if behind and self._skipped < self.max_frame_skip:
+            self._skipped += 1
+            self.frames_skipped += 1
+            return False
+        if behind:
+            # Give up on catching up with the backlog of frames
+            self._next_frame = self._clock()
+        self._skipped = 0
+        self.frames_rendered += 1
+        return True
+
+    def wait(self) -> None:
+        """Sleep until the next frame is due (no-op when already late)."""
+        remaining = self._next_frame - self._clock()
+        if remaining > 0:
+            self._sleep(remaining)
@@ -3,7 +3,7 @@ Application entry: main menu, navigation to game and leaderboard.
 """
 
 import pygame
-from ui import draw_text
+from ui import draw_text, wait_for_events
 from leaderboard import show_leaderboard
 from game import game_loop
 from config import DISPLAY, SCREEN_WIDTH, SCREEN_HEIGHT, WINDOW_TITLE, init_config
@@ -22,26 +22,31 @@ def main_menu() -> None:
     pygame.display.set_caption(WINDOW_TITLE)
 
     is_running = True
+    needs_redraw = True
     while is_running:
-        screen.fill((0, 0, 0))
-        draw_text(screen, "3D Cube Stacking Game",
-                  (SCREEN_WIDTH//2-250, SCREEN_HEIGHT//4-50,
-                   SCREEN_WIDTH//2+250, SCREEN_HEIGHT//4),
-                   size=42, align="center")
-        draw_text(screen, "Press SPACE to start",
-                  (SCREEN_WIDTH//2-200, SCREEN_HEIGHT//2-50,
-                   SCREEN_WIDTH//2+200, SCREEN_HEIGHT//2),
-                   size=32, align="center")
-        draw_text(screen, "Press L to view local leaderboard",
-                  (SCREEN_WIDTH//2-250, SCREEN_HEIGHT//2,
-                   SCREEN_WIDTH//2+250, SCREEN_HEIGHT//2+50),
-                   size=28, align="center")
-        draw_text(screen, "Press ESC to quit",
-                  (SCREEN_WIDTH//2-200, SCREEN_HEIGHT//2+75,
-                   SCREEN_WIDTH//2+200, SCREEN_HEIGHT//2+125),
-                   size=28, align="center")
+        if needs_redraw:
+            screen.fill((0, 0, 0))
+            draw_text(screen, "3D Cube Stacking Game",
+                      (SCREEN_WIDTH//2-250, SCREEN_HEIGHT//4-50,
+                       SCREEN_WIDTH//2+250, SCREEN_HEIGHT//4),
+                       size=42, align="center")
+            draw_text(screen, "Press SPACE to start",
+                      (SCREEN_WIDTH//2-200, SCREEN_HEIGHT//2-50,
+                       SCREEN_WIDTH//2+200, SCREEN_HEIGHT//2),
+                       size=32, align="center")
+            draw_text(screen, "Press L to view local leaderboard",
+                      (SCREEN_WIDTH//2-250, SCREEN_HEIGHT//2,
+                       SCREEN_WIDTH//2+250, SCREEN_HEIGHT//2+50),
+                       size=28, align="center")
+            draw_text(screen, "Press ESC to quit",
+                      (SCREEN_WIDTH//2-200, SCREEN_HEIGHT//2+75,
+                       SCREEN_WIDTH//2+200, SCREEN_HEIGHT//2+125),
+                       size=28, align="center")
+            pygame.display.flip()
 
-        for event in pygame.event.get():
+        events = wait_for_events()
+        needs_redraw = bool(events)
+        for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 quit()
@@ -55,8 +60,6 @@ def main_menu() -> None:
                     pygame.quit()
                     quit()
 
-        pygame.display.flip()
-
 
 if __name__ == "__main__":
     init_config()
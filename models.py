@@ -3,15 +3,18 @@ Core game models and structures.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Tuple
+from typing import List
 
 
-@dataclass
+@dataclass(slots=True)
 class Cube:
     """
     Represents a single cube in the stack with position, rotation, size,
     movement state, and precomputed travel properties.
 
+    Uses __slots__, so instances carry no per-object __dict__. Vectors are
+    3-element lists that are updated in place and never replaced.
+
     Attributes:
         position (List[float]): [x, y, z] position in world space.
         rotation (List[float]): [rx, ry, rz] rotation angles in degrees.
@@ -0,0 +1,123 @@
+"""
+Frame profiler: per-phase timings of the game loop, rolling percentiles,
+an on-screen overlay and CSV/JSON dumps.
+
+The game loop holds None instead of a FrameProfiler when profiling is off,
+so disabled profiling costs one `if profiler` test per phase.
+"""
+
+import csv
+import json
+import os
+import time
+from collections import deque
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from config import PROFILER_WINDOW, PROFILER_MAX_ROWS
+
+
+PHASES = ("events", "simulate", "render", "hud", "flip", "wait")
+PERCENTILES = (50, 95, 99)
+
+
+class FrameProfiler:
+    """
+    Times the phases of each frame with a lap clock.
+
+    Call start_frame() at the top of the loop, lap(phase) after each phase
+    (the time since the previous lap is charged to it) and end_frame() at
+    the bottom. Phases that do not run in a frame (rendering, in a skipped
+    frame) count as zero.
+
+    Attributes:
+        phases (Tuple[str, ...]): Phase names, in column order.
+        frames (int): Frames ended since the profiler was created.
+        rows (deque): Seconds per phase plus the whole frame, one row per
+            frame, for the last `max_rows` frames (a game that never ends,
+            such as an autoplay soak, must not grow it without bound).
+        recent (deque): The last `window` rows, for rolling percentiles.
+    """
+
+    def __init__(self, phases: Sequence[str] = PHASES, window: int = PROFILER_WINDOW,
+                 max_rows: int = PROFILER_MAX_ROWS, clock=time.perf_counter):
+        self.phases = tuple(phases)
+        self._column = {phase: i for i, phase in enumerate(self.phases)}
+        self.frames = 0
+        self.rows = deque(maxlen=max_rows)
+        self.recent = deque(maxlen=window)
+        self._clock = clock
+        self._current = [0.0] * len(self.phases)
+        self._frame_start = self._last = clock()
+
+    def start_frame(self) -> None:
+        self._current = [0.0] * len(self.phases)
+        self._frame_start = self._last = self._clock()
+
+    def lap(self, phase: str) -> None:
+        now = self._clock()
+        self._current[self._column[phase]] += now - self._last
+        self._last = now
+
+    def end_frame(self) -> None:
+        row = tuple(self._current) + (self._last - self._frame_start,)
+        self.rows.append(row)
+        self.recent.append(row)
+        self.frames += 1
+
+    def percentiles(self, recent: bool = True) -> Dict[str, Dict[str, float]]:
+        """
+        p50/p95/p99 of each phase and of the whole frame, in milliseconds.
+
+        Parameters:
+            recent (bool): Over the rolling window if True, else every
+                retained row.
+
+        Returns:
+            Dict[str, Dict[str, float]]: {"frame" or phase: {"p50": ms, ...}}.
+        """
+        rows = self.recent if recent else self.rows
+        if not rows:
+            return {}
+        values = np.percentile(np.array(rows) * 1000.0, PERCENTILES, axis=0)
+        return {
+            name: {f"p{p}": float(values[i, column]) for i, p in enumerate(PERCENTILES)}
+            for column, name in enumerate(self.phases + ("frame",))
+        }
+
+    def overlay_lines(self) -> List[str]:
+        """Text lines for the HUD: rolling percentiles (ms) of the frame and each phase."""
+        stats = self.percentiles()
+        return [
+            f"{name:8}" + "".join(f" {key} {value:6.2f}" for key, value in stats[name].items())
+            for name in ("frame",) + self.phases if name in stats
+        ]
+
+    def dump(self, directory: str, name: str, extra: Optional[dict] = None) -> Tuple[str, str]:
+        """
+        Write the retained frames to <name>.csv and their percentiles to
+        <name>.json in a directory, creating it if needed; the CSV numbers
+        frames from the start of the run.
+
+        Parameters:
+            directory (str): Folder for the two files.
+            name (str): File name without extension.
+            extra (Optional[dict]): More figures to include in the JSON.
+
+        Returns:
+            Tuple[str, str]: Paths of the CSV and JSON files.
+        """
+        os.makedirs(directory, exist_ok=True)
+        csv_path = os.path.join(directory, name + ".csv")
+        json_path = os.path.join(directory, name + ".json")
+        with open(csv_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame"] + [f"{phase}_ms" for phase in self.phases] + ["total_ms"])
+            first = self.frames - len(self.rows)
+            for i, row in enumerate(self.rows, first):
+                writer.writerow([i] + [f"{value * 1000.0:.4f}" for value in row])
+        with open(json_path, "w") as f:
+            summary = {"frames": self.frames, "frames_kept": len(self.rows),
+                       "percentiles_ms": self.percentiles(recent=False)}
+            summary.update(extra or {})
+            json.dump(summary, f, indent=2)
+        return csv_path, json_path
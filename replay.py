@@ -0,0 +1,181 @@
+"""
+Game replays: the seed of a game and the ticks at which SPACE was pressed,
+in a compact binary file, re-simulated headlessly to check its score.
+
+File layout (little-endian):
+    a 21-byte header of magic "CSRP", version (u8), seed (u64), score (u32)
+    and drop count (u32), then one unsigned LEB128 varint per drop: ticks
+    since the previous drop.
+"""
+
+import os
+import struct
+from dataclasses import dataclass, field
+from typing import List
+from simulation import Simulation
+from config import REPLAY_DIR, REPLAY_MAX_DROPS, REPLAY_MAX_TICK_GAP, REPLAY_MAX_TICKS
+
+
+REPLAY_MAGIC = b"CSRP"
+REPLAY_VERSION = 1
+REPLAY_EXTENSION = ".csrp"
+
+_HEADER = struct.Struct("<4sBQII")
+
+
+@dataclass
+class Replay:
+    """
+    Everything needed to replay one game.
+
+    Attributes:
+        seed (int): Seed of the game's Simulation (0 <= seed < 2**64).
+        drop_ticks (List[int]): Simulation tick of each SPACE press, strictly
+            ascending (the game takes at most one drop per tick).
+        score (int): Score the game claims to have reached.
+    """
+    seed: int
+    drop_ticks: List[int] = field(default_factory=list)
+    score: int = 0
+
+    @classmethod
+    def from_simulation(cls, sim: Simulation) -> "Replay":
+        """Record a game played through a Simulation."""
+        return cls(seed=sim.seed, drop_ticks=list(sim.drop_ticks), score=sim.score)
+
+
+def encode_replay(replay: Replay) -> bytes:
+    """
+    Serialise a replay to the binary format.
+
+    Returns:
+        bytes: Header followed by the varint drop-tick deltas.
+    """
+    body = bytearray()
+    previous = 0
+    for tick in replay.drop_ticks:
+        delta = tick - previous
+        if delta < 0:
+            raise ValueError("drop ticks must be ascending")
+        previous = tick
+        while delta >= 0x80:
+            body.append((delta & 0x7F) | 0x80)
+            delta >>= 7
+        body.append(delta)
+    header = _HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, replay.seed,
+                          replay.score, len(replay.drop_ticks))
+    return header + bytes(body)
+
+
+def decode_replay(data: bytes) -> Replay:
+    """
+    Parse a replay from the binary format.
+
+    Raises:
+        ValueError: If the data is not a replay this version can read.
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError("replay is truncated")
+    magic, version, seed, score, count = _HEADER.unpack_from(data)
+    if magic != REPLAY_MAGIC:
+        raise ValueError("not a replay file")
+    if version != REPLAY_VERSION:
+        raise ValueError(f"unsupported replay version {version}")
+
+    drop_ticks = []
+    tick = 0
+    offset = _HEADER.size
+    for _ in range(count):
+        delta = shift = 0
+        while True:
+            if offset >= len(data):
+                raise ValueError("replay is truncated")
+            byte = data[offset]
+            offset += 1
+            delta |= (byte & 0x7F) << shift
+            shift += 7
+            if byte < 0x80:
+                break
+        tick += delta
+        drop_ticks.append(tick)
+    return Replay(seed=seed, drop_ticks=drop_ticks, score=score)
+
+
+def save_replay(replay: Replay, directory: str = REPLAY_DIR) -> str:
+    """
+    Write a replay into a directory, creating it if needed.
+
+    Returns:
+        str: Path of the written file, named after the seed and score.
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{replay.seed:016x}-{replay.score}{REPLAY_EXTENSION}")
+    with open(path, "wb") as f:
+        f.write(encode_replay(replay))
+    return path
+
+
+def load_replay(path: str) -> Replay:
+    """Read a replay file."""
+    with open(path, "rb") as f:
+        return decode_replay(f.read())
+
+
+def validate_replay(replay: Replay) -> None:
+    """
+    Check that a replay describes a game that can be re-simulated in
+    bounded time.
+
+    Raises:
+        ValueError: If the seed or score is not an integer in range, the
+            drop ticks are negative or not strictly ascending, or the game
+            exceeds REPLAY_MAX_DROPS, REPLAY_MAX_TICK_GAP or REPLAY_MAX_TICKS.
+    """
+    # type() rather than isinstance(): JSON true/false decode to bool, an int subclass
+    if type(replay.seed) is not int or not 0 <= replay.seed < 2 ** 64:
+        raise ValueError("seed must be an integer in [0, 2**64)")
+    if type(replay.score) is not int or replay.score < 0:
+        raise ValueError("score must be a non-negative integer")
+    if len(replay.drop_ticks) > REPLAY_MAX_DROPS:
+        raise ValueError(f"more than {REPLAY_MAX_DROPS} drops")
+    previous = -1
+    for tick in replay.drop_ticks:
+        if type(tick) is not int or tick < 0:
+            raise ValueError("drop ticks must be non-negative integers")
+        if tick <= previous:
+            raise ValueError("drop ticks must be strictly ascending")
+        if tick - max(previous, 0) > REPLAY_MAX_TICK_GAP:
+            raise ValueError(f"more than {REPLAY_MAX_TICK_GAP} ticks between drops")
+        previous = tick
+    if previous > REPLAY_MAX_TICKS:
+        raise ValueError(f"longer than {REPLAY_MAX_TICKS} ticks")
+
+
+def simulate_replay(replay: Replay) -> Simulation:
+    """
+    Re-play a game headlessly: run the seeded simulation up to each recorded
+    drop tick and drop. The game ends at the first miss, which must be the
+    last recorded drop.
+
+    Returns:
+        Simulation: The game in its final state.
+
+    Raises:
+        ValueError: If the replay fails validate_replay, or holds drops
+            after the one that lost the game.
+    """
+    validate_replay(replay)
+    sim = Simulation(replay.seed)
+    for number, tick in enumerate(replay.drop_ticks, 1):
+        sim.run(tick - sim.tick_count)
+        if sim.drop():
+            if number < len(replay.drop_ticks):
+                extra = len(replay.drop_ticks) - number
+                raise ValueError(f"{extra} drop(s) recorded after the game was lost")
+            break
+    return sim
+
+
+def verify_replay(replay: Replay) -> bool:
+    """True if re-simulating the replay reaches exactly its claimed score."""
+    return simulate_replay(replay).score == replay.score
@@ -0,0 +1,294 @@
+"""
+Core-profile rendering path: one small GLSL program draws the whole stack
+as instances of a unit cube, another draws the HUD text, so a frame is a
+handful of draw calls and uses no fixed-function state.
+
+View and projection are built on the CPU once per frame from the camera
+compute_camera_position returns; each cube's origin, size, rotation and
+atlas tile are per-instance vertex attributes. Needs an OpenGL 3.3 core
+context (call request_core_profile() before pygame.display.set_mode);
+runs on Mesa llvmpipe.
+"""
+
+import ctypes
+import math
+from typing import Dict, List
+import numpy as np
+import pygame
+from OpenGL.GL import *
+from OpenGL.GL.shaders import compileProgram, compileShader
+import gl_state
+from graphics import CUBE_FACES, CUBE_TEX_COORDS, ATLAS_TILES, TILE_INSET
+from batch_renderer import collect_instances
+from hud import get_atlas
+from config import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, FOV_Y, NEAR_PLANE, FAR_PLANE, texture_atlas
+)
+
+
+_FLOAT_SIZE = 4
+INSTANCE_FLOATS = 10    # origin (3), size (3), rotation (3), tile (1)
+
+CUBE_VERTEX_SHADER = """
+#version 330 core
+layout(location = 0) in vec2 a_uv;
+layout(location = 1) in vec3 a_corner;
+layout(location = 2) in vec3 i_origin;
+layout(location = 3) in vec3 i_size;
+layout(location = 4) in vec3 i_rotation;   // degrees, applied like glRotatef x, y, z
+layout(location = 5) in float i_tile;
+
+uniform mat4 u_view_projection;
+uniform float u_tiles;
+uniform float u_tile_inset;
+
+out vec2 v_uv;
+
+mat3 rotation(vec3 degrees) {
+    vec3 c = cos(radians(degrees));
+    vec3 s = sin(radians(degrees));
+    mat3 rx = mat3(1.0, 0.0, 0.0,  0.0, c.x, s.x,  0.0, -s.x, c.x);
+    mat3 ry = mat3(c.y, 0.0, -s.y,  0.0, 1.0, 0.0,  s.y, 0.0, c.y);
+    mat3 rz = mat3(c.z, s.z, 0.0,  -s.z, c.z, 0.0,  0.0, 0.0, 1.0);
+    return rx * ry * rz;
+}
+
+void main() {
+    vec3 local = a_corner * i_size;
+    if (i_rotation != vec3(0.0)) {
+        local = rotation(i_rotation) * local;
+    }
+    gl_Position = u_view_projection * vec4(i_origin + local, 1.0);
+    v_uv = vec2(a_uv.x, (i_tile + u_tile_inset + a_uv.y * (1.0 - 2.0 * u_tile_inset)) / u_tiles);
+}
+"""
+
+TEXTURED_FRAGMENT_SHADER = """
+#version 330 core
+in vec2 v_uv;
+uniform sampler2D u_texture;
+out vec4 frag_color;
+
+void main() {
+    frag_color = texture(u_texture, v_uv);
+}
+"""
+
+HUD_VERTEX_SHADER = """
+#version 330 core
+layout(location = 0) in vec2 a_uv;
+layout(location = 1) in vec2 a_position;
+uniform mat4 u_projection;
+out vec2 v_uv;
+
+void main() {
+    gl_Position = u_projection * vec4(a_position, 0.0, 1.0);
+    v_uv = a_uv;
+}
+"""
+
+
+def request_core_profile() -> None:
+    """Ask SDL for an OpenGL 3.3 core context on the next set_mode."""
+    pygame.display.gl_set_attribute(pygame.GL_CONTEXT_MAJOR_VERSION, 3)
+    pygame.display.gl_set_attribute(pygame.GL_CONTEXT_MINOR_VERSION, 3)
+    pygame.display.gl_set_attribute(pygame.GL_CONTEXT_PROFILE_MASK,
+                                    pygame.GL_CONTEXT_PROFILE_CORE)
+    # Required for core contexts on macOS, harmless elsewhere
+    pygame.display.gl_set_attribute(pygame.GL_CONTEXT_FLAGS,
+                                    pygame.GL_CONTEXT_FORWARD_COMPATIBLE_FLAG)
+
+
+def perspective_matrix(fov_y: float, aspect: float, near: float, far: float) -> np.ndarray:
+    """Row-major projection matrix equal to gluPerspective's."""
+    f = 1.0 / math.tan(math.radians(fov_y) / 2.0)
+    return np.array([
+        [f / aspect, 0.0, 0.0, 0.0],
+        [0.0, f, 0.0, 0.0],
+        [0.0, 0.0, (far + near) / (near - far), 2.0 * far * near / (near - far)],
+        [0.0, 0.0, -1.0, 0.0],
+    ])
+
+
+def look_at_matrix(eye, target, up=(0.0, 1.0, 0.0)) -> np.ndarray:
+    """Row-major view matrix equal to gluLookAt's."""
+    eye = np.asarray(eye, dtype=np.float64)
+    forward = np.asarray(target, dtype=np.float64) - eye
+    forward /= np.linalg.norm(forward)
+    side = np.cross(forward, up)
+    side /= np.linalg.norm(side)
+    upward = np.cross(side, forward)
+    view = np.identity(4)
+    view[0, :3], view[1, :3], view[2, :3] = side, upward, -forward
+    view[:3, 3] = -view[:3, :3] @ eye
+    return view
+
+
+def ortho_matrix(left: float, right: float, bottom: float, top: float) -> np.ndarray:
+    """Row-major projection matrix equal to gluOrtho2D's."""
+    return np.array([
+        [2.0 / (right - left), 0.0, 0.0, -(right + left) / (right - left)],
+        [0.0, 2.0 / (top - bottom), 0.0, -(top + bottom) / (top - bottom)],
+        [0.0, 0.0, -1.0, 0.0],
+        [0.0, 0.0, 0.0, 1.0],
+    ])
+
+
+def build_cube_triangles() -> np.ndarray:
+    """
+    Build the unit cube as a triangle list (core profiles have no quads).
+
+    Returns:
+        np.ndarray: (36, 5) float32 array of [u, v, x, y, z] rows.
+    """
+    rows = []
+    for face in CUBE_FACES:
+        for i in (0, 1, 2, 0, 2, 3):
+            rows.append(CUBE_TEX_COORDS[i] + face[i])
+    return np.array(rows, dtype=np.float32)
+
+
+def _attribute(location: int, size: int, stride: int, offset: int, divisor: int = 0) -> None:
+    glEnableVertexAttribArray(location)
+    glVertexAttribPointer(location, size, GL_FLOAT, GL_FALSE, stride,
+                          ctypes.c_void_p(offset * _FLOAT_SIZE))
+    if divisor:
+        glVertexAttribDivisor(location, divisor)
+
+
+class ShaderRenderer:
+    """
+    Programs, vertex arrays and buffers of the core-profile path, for the
+    current GL context.
+
+    Per frame: set_camera() once, draw_stack(), draw_text() for each HUD
+    string, then flush_text() to draw the queued strings (one draw call
+    per font size). release() frees the GL objects.
+    """
+
+    def __init__(self):
+        cube = build_cube_triangles()
+        self.cube_vertex_count = len(cube)
+
+        self.cube_vao = glGenVertexArrays(1)
+        gl_state.bind_vertex_array(self.cube_vao)
+        self.cube_buffer = glGenBuffers(1)
+        gl_state.bind_buffer(GL_ARRAY_BUFFER, self.cube_buffer)
+        glBufferData(GL_ARRAY_BUFFER, cube.nbytes, cube, GL_STATIC_DRAW)
+        _attribute(0, 2, 5 * _FLOAT_SIZE, 0)
+        _attribute(1, 3, 5 * _FLOAT_SIZE, 2)
+        self.instance_buffer = glGenBuffers(1)
+        gl_state.bind_buffer(GL_ARRAY_BUFFER, self.instance_buffer)
+        stride = INSTANCE_FLOATS * _FLOAT_SIZE
+        _attribute(2, 3, stride, 0, divisor=1)
+        _attribute(3, 3, stride, 3, divisor=1)
+        _attribute(4, 3, stride, 6, divisor=1)
+        _attribute(5, 1, stride, 9, divisor=1)
+        # Programs are validated against the bound vertex array
+        self.cube_program = compileProgram(
+            compileShader(CUBE_VERTEX_SHADER, GL_VERTEX_SHADER),
+            compileShader(TEXTURED_FRAGMENT_SHADER, GL_FRAGMENT_SHADER))
+
+        self.hud_vao = glGenVertexArrays(1)
+        gl_state.bind_vertex_array(self.hud_vao)
+        self.hud_buffer = glGenBuffers(1)
+        gl_state.bind_buffer(GL_ARRAY_BUFFER, self.hud_buffer)
+        _attribute(0, 2, 4 * _FLOAT_SIZE, 0)
+        _attribute(1, 2, 4 * _FLOAT_SIZE, 2)
+        self.hud_program = compileProgram(
+            compileShader(HUD_VERTEX_SHADER, GL_VERTEX_SHADER),
+            compileShader(TEXTURED_FRAGMENT_SHADER, GL_FRAGMENT_SHADER))
+
+        # Uniforms that never change are set once
+        glUseProgram(self.cube_program)
+        glUniform1f(glGetUniformLocation(self.cube_program, "u_tiles"), ATLAS_TILES)
+        glUniform1f(glGetUniformLocation(self.cube_program, "u_tile_inset"), TILE_INSET)
+        glUniform1i(glGetUniformLocation(self.cube_program, "u_texture"), 0)
+        self._view_projection = glGetUniformLocation(self.cube_program, "u_view_projection")
+        glUseProgram(self.hud_program)
+        glUniform1i(glGetUniformLocation(self.hud_program, "u_texture"), 0)
+        glUniformMatrix4fv(glGetUniformLocation(self.hud_program, "u_projection"), 1, GL_TRUE,
+                           ortho_matrix(0, SCREEN_WIDTH, 0, SCREEN_HEIGHT).astype(np.float32))
+        self._program = self.hud_program
+
+        self._text: Dict[int, List[np.ndarray]] = {}
+
+    def _use(self, program: int) -> None:
+        if program != self._program:
+            glUseProgram(program)
+            self._program = program
+
+    def set_camera(self, camera, fov_y: float = FOV_Y,
+                   aspect: float = SCREEN_WIDTH / SCREEN_HEIGHT,
+                   near: float = NEAR_PLANE, far: float = FAR_PLANE) -> None:
+        """
+        Upload this frame's view-projection matrix.
+
+        Parameters:
+            camera (tuple): (cam_x, cam_y, cam_z, tar_x, tar_y, tar_z) from
+                compute_camera_position.
+        """
+        view_projection = perspective_matrix(fov_y, aspect, near, far) @ look_at_matrix(
+            camera[:3], camera[3:])
+        self._use(self.cube_program)
+        glUniformMatrix4fv(self._view_projection, 1, GL_TRUE, view_projection.astype(np.float32))
+
+    def draw_stack(self, stack, window=None) -> None:
+        """
+        Draw the stack with one instanced draw call.
+
+        Parameters:
+            stack (List[Cube]): Cubes to draw, bottom to top.
+            window (Optional[Tuple[int, int]]): Half-open index range to draw;
+                the whole stack when None.
+        """
+        lo, hi = window if window is not None else (0, len(stack))
+        if lo >= hi:
+            return
+        positions, sizes, rotations, texture_ids = collect_instances(stack, lo, hi)
+        instances = np.empty((hi - lo, INSTANCE_FLOATS), dtype=np.float32)
+        instances[:, 0:3] = positions
+        instances[:, 3:6] = sizes
+        instances[:, 6:9] = rotations
+        instances[:, 9] = texture_ids
+
+        self._use(self.cube_program)
+        gl_state.enable(GL_DEPTH_TEST)
+        gl_state.disable(GL_BLEND)
+        gl_state.bind_texture(GL_TEXTURE_2D, texture_atlas["id"])
+        gl_state.bind_vertex_array(self.cube_vao)
+        gl_state.bind_buffer(GL_ARRAY_BUFFER, self.instance_buffer)
+        glBufferData(GL_ARRAY_BUFFER, instances.nbytes, instances, GL_STREAM_DRAW)
+        glDrawArraysInstanced(GL_TRIANGLES, 0, self.cube_vertex_count, len(instances))
+
+    def draw_text(self, text: str, x: int, y: int, font_size: int = 28) -> None:
+        """Queue a HUD string (bottom-left at x, y) for flush_text()."""
+        quads = get_atlas(font_size).build_quads(text, x, y)
+        if len(quads):
+            triangles = quads.reshape(-1, 4, 4)[:, (0, 1, 2, 0, 2, 3)].reshape(-1, 4)
+            self._text.setdefault(font_size, []).append(triangles)
+
+    def flush_text(self) -> None:
+        """Draw every queued HUD string over the scene, one draw call per font size."""
+        if not self._text:
+            return
+        self._use(self.hud_program)
+        gl_state.disable(GL_DEPTH_TEST)
+        gl_state.enable(GL_BLEND)
+        gl_state.blend_func(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        gl_state.bind_vertex_array(self.hud_vao)
+        gl_state.bind_buffer(GL_ARRAY_BUFFER, self.hud_buffer)
+        for font_size, strings in self._text.items():
+            vertices = np.concatenate(strings)
+            gl_state.bind_texture(GL_TEXTURE_2D, get_atlas(font_size).texture_id)
+            glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STREAM_DRAW)
+            glDrawArrays(GL_TRIANGLES, 0, len(vertices))
+        self._text = {}
+
+    def release(self) -> None:
+        """Delete the programs, vertex arrays and buffers."""
+        glUseProgram(0)
+        glDeleteProgram(self.cube_program)
+        glDeleteProgram(self.hud_program)
+        gl_state.delete_vertex_arrays([self.cube_vao, self.hud_vao])
+        gl_state.delete_buffers([self.cube_buffer, self.instance_buffer, self.hud_buffer])
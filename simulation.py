@@ -0,0 +1,105 @@
+"""
+Headless game session: the stack, its random source and tick stepping,
+with no dependency on pygame or OpenGL.
+"""
+
+import random
+from typing import List, Optional
+from models import Cube
+from cube_stack import Stack
+from cube_special import apply_random_acceleration, teleport_forward
+from game_logic import update_cube_motion, spawn_next_cube, stop_and_spawn
+from config import (
+    INITIAL_CUBE_POS, INITIAL_CUBE_SIZE,
+    SPECIAL_INTERVAL_TICKS, ACCELERATION_RANGE
+)
+
+
+class Simulation:
+    """
+    One game of cube stacking, advanced one fixed tick at a time.
+
+    The pygame loop is a front-end over this: it calls step() once per
+    simulation tick and drop() when SPACE is pressed. Headless tools do the
+    same without a window.
+
+    Attributes:
+        seed (int): Seed of the game's random source; drawn at random when
+            none is given, so every game can be replayed.
+        rng (random.Random): Random source for spawns and special cubes.
+        stack (Stack): Cubes from the bottom up; stack[-1] is moving.
+        active (Cube): stack[-1], kept as an attribute for the tick loop.
+        tick_count (int): Ticks simulated so far.
+        lost (bool): True once a drop missed the cube below.
+        drop_ticks (List[int]): tick_count at each drop, for replays.
+        texture_pool (Optional[List[str]]): Cube types spawned (see
+            spawn_next_cube); every type when None.
+    """
+
+    def __init__(self, seed: Optional[int] = None,
+                 texture_pool: Optional[List[str]] = None):
+        self.seed = seed if seed is not None else random.getrandbits(64)
+        self.rng = random.Random(self.seed)
+        self.tick_count = 0
+        self.lost = False
+        self.drop_ticks: List[int] = []
+        self.texture_pool = texture_pool
+        self.stack = Stack([
+            Cube(
+                position=list(INITIAL_CUBE_POS),
+                rotation=[0.0, 0.0, 0.0],
+                size=list(INITIAL_CUBE_SIZE),
+                moving_state=0
+            )
+        ])
+        spawn_next_cube(self.stack, self.rng, texture_pool=texture_pool)
+        self.active = self.stack[-1]
+
+    @property
+    def score(self) -> int:
+        """Cubes successfully stacked so far."""
+        return len(self.stack) - 2
+
+    def step(self) -> bool:
+        """
+        Advance the game by one tick: move the active cube, then apply its
+        special effect every SPECIAL_INTERVAL_TICKS ticks.
+
+        Returns:
+            bool: True if the active cube jumped (teleported) this tick.
+        """
+        if self.lost:
+            return False
+        active = self.active
+        if active.moving_state in (1, 2):
+            update_cube_motion(active)
+
+        jumped = False
+        if self.tick_count % SPECIAL_INTERVAL_TICKS == 0:
+            if active.texture_id == "var_a":
+                apply_random_acceleration(active, *ACCELERATION_RANGE, rng=self.rng)
+            elif active.texture_id == "var_pos":
+                teleport_forward(active, self.rng)
+                jumped = True
+
+        self.tick_count += 1
+        return jumped
+
+    def run(self, ticks: int) -> None:
+        """Advance the game by a number of ticks without dropping."""
+        for _ in range(ticks):
+            self.step()
+
+    def drop(self) -> bool:
+        """
+        Stop the active cube, trim it and spawn the next one.
+
+        Returns:
+            bool: True if the drop missed and the game is lost.
+        """
+        if self.lost:
+            return True
+        self.drop_ticks.append(self.tick_count)
+        self.lost = stop_and_spawn(self.stack, self.rng, self.texture_pool)
+        self.active = self.stack[-1]
+        return self.lost
@@ -0,0 +1,124 @@
+"""
+Static-geometry cache: settled cubes are baked once into an append-only
+vertex buffer (with atlas UVs) so each frame only re-submits the moving cube.
+"""
+
+import numpy as np
+from OpenGL.GL import *
+import gl_state
+from vbo_renderer import (
+    begin_textured_arrays, draw_stack as draw_moving_cubes, CUBE_VERTEX_COUNT, VERTEX_STRIDE
+)
+from batch_renderer import collect_instances, expand_instances
+
+
+class _CubeBatch:
+    """Append-only vertex buffer of baked cubes; cube i is stack[i]."""
+
+    def __init__(self, capacity: int):
+        self.buffer = glGenBuffers(1)
+        self.capacity = capacity
+        self.vertices = np.empty((capacity * CUBE_VERTEX_COUNT, 5), dtype=np.float32)
+        self.count = 0
+        gl_state.bind_buffer(GL_ARRAY_BUFFER, self.buffer)
+        glBufferData(GL_ARRAY_BUFFER, self.vertices.nbytes, None, GL_STATIC_DRAW)
+
+    def append(self, vertices: np.ndarray) -> None:
+        """Append whole-cube vertex rows, doubling the buffer when full."""
+        added = len(vertices) // CUBE_VERTEX_COUNT
+        start = self.count * CUBE_VERTEX_COUNT
+        end = start + len(vertices)
+        gl_state.bind_buffer(GL_ARRAY_BUFFER, self.buffer)
+        if self.count + added > self.capacity:
+            while self.count + added > self.capacity:
+                self.capacity *= 2
+            grown = np.empty((self.capacity * CUBE_VERTEX_COUNT, 5), dtype=np.float32)
+            grown[:start] = self.vertices[:start]
+            grown[start:end] = vertices
+            self.vertices = grown
+            glBufferData(GL_ARRAY_BUFFER, grown.nbytes, grown, GL_STATIC_DRAW)
+        else:
+            self.vertices[start:end] = vertices
+            glBufferSubData(GL_ARRAY_BUFFER, start * VERTEX_STRIDE,
+                            vertices.nbytes, vertices)
+        self.count += added
+
+    def release(self) -> None:
+        gl_state.delete_buffers([self.buffer])
+
+
+class StaticStackCache:
+    """
+    Cache of every settled cube of a stack, baked on the GPU.
+
+    Cubes below stack[-1] never change once stop_and_spawn has returned, so
+    they are transformed once, appended to one buffer in stack order, and
+    drawn each frame with a single glDrawArrays.
+
+    Attributes:
+        baked (int): Number of stack entries (from the bottom) already baked.
+    """
+
+    def __init__(self, initial_capacity: int = 64):
+        self.initial_capacity = initial_capacity
+        self.batch = None
+        self.baked = 0
+
+    def sync(self, stack) -> None:
+        """
+        Bake every settled cube that is not cached yet.
+
+        Parameters:
+            stack (List[Cube]): Current stack; stack[-1] is the moving cube.
+        """
+        settled = len(stack) - 1
+        if settled <= self.baked:
+            return
+        vertices = expand_instances(*collect_instances(stack, self.baked, settled))
+        if self.batch is None:
+            self.batch = _CubeBatch(self.initial_capacity)
+        self.batch.append(vertices)
+        self.baked = settled
+
+    def draw(self, lo: int = 0, hi: int = None) -> None:
+        """
+        Draw the baked cubes whose stack index lies in [lo, hi) with one
+        draw call. The batch is in stack order, so the window maps to one
+        contiguous vertex range.
+        """
+        batch = self.batch
+        if batch is None:
+            return
+        first = max(lo, 0)
+        last = batch.count if hi is None else min(hi, batch.count)
+        if first >= last:
+            return
+        begin_textured_arrays(batch.buffer)
+        glDrawArrays(GL_QUADS, first * CUBE_VERTEX_COUNT, (last - first) * CUBE_VERTEX_COUNT)
+
+    def draw_stack(self, stack, window=None) -> None:
+        """
+        Draw the stack from the cache plus the cubes not baked yet.
+
+        Parameters:
+            stack (List[Cube]): Cubes to draw, bottom to top.
+            window (Optional[Tuple[int, int]]): Half-open index range to
+                draw; the whole stack when None.
+        """
+        lo, hi = window if window is not None else (0, len(stack))
+        self.sync(stack)
+        self.draw(lo, hi)
+        draw_moving_cubes(stack, (max(lo, self.baked), max(hi, self.baked)))
+
+    def reset(self) -> None:
+        """Forget every baked cube, keeping the buffer for the next stack."""
+        if self.batch is not None:
+            self.batch.count = 0
+        self.baked = 0
+
+    def release(self) -> None:
+        """Delete the cache's GL buffers and forget every baked cube."""
+        if self.batch is not None:
+            self.batch.release()
+        self.batch = None
+        self.baked = 0
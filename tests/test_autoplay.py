@@ -0,0 +1,77 @@
+"""
+AutoPlayer predictions against the simulation: best_drop from random
+mid-flight states, checked by stepping a copy of the cube.
+"""
+
+import copy
+import random
+import pytest
+from autoplay import best_drop, predict_xz, ticks_to_bounce
+from game_logic import intersect_rect, update_cube_motion
+from simulation import Simulation
+
+
+def mid_flight_states(count: int, seed: int = 0, past_target=None):
+    """(cube, base) pairs taken after a random number of ticks of seeded games."""
+    rng = random.Random(seed)
+    states = []
+    while len(states) < count:
+        sim = Simulation(rng.randrange(2 ** 32))
+        sim.run(rng.randrange(1, 400))
+        cube = sim.active
+        if cube.step_distance() == 0:
+            continue
+        if cube.moving_state == 1:
+            past = cube.traveled > cube.travel_distance
+        else:
+            past = cube.traveled < cube.travel_distance
+        if past_target is None or past == past_target:
+            states.append((cube, sim.stack[-2]))
+    return states
+
+
+def stepped(cube, ticks: int):
+    moved = copy.deepcopy(cube)
+    for _ in range(ticks):
+        update_cube_motion(moved)
+    return moved
+
+
+def kept_fraction(cube, base) -> float:
+    overlap = intersect_rect((cube.position[0], cube.position[2], cube.size[0], cube.size[2]),
+                             (base.position[0], base.position[2], base.size[0], base.size[2]))
+    if overlap is None:
+        return 0.0
+    return overlap[2] * overlap[3] / (cube.size[0] * cube.size[2])
+
+
+def first_pass(cube) -> int:
+    """First tick at or after which the stepped cube has passed its target."""
+    moved = copy.deepcopy(cube)
+    for n in range(1, 100000):
+        before = moved.traveled - moved.travel_distance
+        update_cube_motion(moved)
+        after = moved.traveled - moved.travel_distance
+        if before == 0:
+            return n - 1
+        if (before < 0) != (after < 0) or after == 0:
+            return n
+    raise AssertionError("cube never passed its target")
+
+
+@pytest.mark.parametrize("past_target", [True, False])
+def test_predict_xz_matches_stepping_up_to_the_next_bounce(past_target):
+    for cube, _ in mid_flight_states(100, seed=1, past_target=past_target):
+        for n in range(2 * ticks_to_bounce(cube)[0] + 1):
+            moved = stepped(cube, n)
+            assert predict_xz(cube, n) == pytest.approx((moved.position[0], moved.position[2]),
+                                                        abs=1e-9)
+
+
+@pytest.mark.parametrize("past_target", [True, False])
+def test_best_drop_matches_stepping(past_target):
+    for cube, base in mid_flight_states(150, seed=2, past_target=past_target):
+        ticks, kept = best_drop(cube, base)
+        # The chosen tick is one of the two around the stepped cube's next pass
+        assert first_pass(cube) - 1 <= ticks <= first_pass(cube)
+        assert kept == pytest.approx(kept_fraction(stepped(cube, ticks), base), abs=1e-9)
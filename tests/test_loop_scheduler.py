@@ -0,0 +1,109 @@
+"""
+FixedStepScheduler on a fake clock: tick accounting, interpolation alpha,
+catch-up capping and frame skipping.
+"""
+
+import pytest
+from loop_scheduler import FixedStepScheduler
+
+
+class FakeClock:
+    """Manual clock; sleeping advances it."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def make_scheduler(**kwargs):
+    clock = FakeClock()
+    # Power-of-two rates keep the float arithmetic exact
+    scheduler = FixedStepScheduler(64, 32, clock=clock, sleep=clock.sleep, **kwargs)
+    return scheduler, clock
+
+
+def test_ticks_follow_elapsed_time():
+    scheduler, clock = make_scheduler()
+    clock.now += 5 / 64
+    assert scheduler.advance() == 5
+    assert scheduler.alpha == 0.0
+    clock.now += 3 / 64
+    assert scheduler.advance() == 3
+    assert scheduler.ticks == 8
+
+
+def test_alpha_carries_the_partial_tick():
+    scheduler, clock = make_scheduler()
+    clock.now += 2.5 / 64
+    assert scheduler.advance() == 2
+    assert scheduler.alpha == pytest.approx(0.5)
+    clock.now += 0.75 / 64
+    assert scheduler.advance() == 1
+    assert scheduler.alpha == pytest.approx(0.25)
+    assert 0.0 <= scheduler.alpha < 1.0
+
+
+def test_stall_is_capped_at_max_frame_time():
+    scheduler, clock = make_scheduler(max_frame_time=0.25)
+    clock.now += 10.0
+    assert scheduler.advance() == 16      # 0.25 s at 64 Hz, not 640 ticks
+    assert scheduler.alpha == 0.0
+    clock.now += 1 / 64
+    assert scheduler.advance() == 1
+
+
+def test_on_time_frames_render_and_wait_out_the_frame():
+    scheduler, clock = make_scheduler()
+    scheduler.advance()
+    assert scheduler.should_render()
+    clock.now += 1 / 128
+    scheduler.wait()
+    assert clock.slept == [pytest.approx(3 / 128)]
+    assert clock.now == pytest.approx(1 / 32)
+
+
+def test_frames_behind_are_skipped_at_most_max_frame_skip_in_a_row():
+    scheduler, clock = make_scheduler(max_frame_skip=3)
+    clock.now += 1.0      # far behind schedule
+    results = [scheduler.should_render() for _ in range(5)]
+    # The fourth frame is drawn regardless and restarts the schedule from now
+    assert results == [False, False, False, True, True]
+    assert scheduler.frames_skipped == 3
+    assert scheduler.frames_rendered == 2
+
+
+def test_render_after_giving_up_resyncs_the_schedule():
+    scheduler, clock = make_scheduler(max_frame_skip=0)
+    clock.now += 1.0
+    assert scheduler.should_render()
+    # Schedule restarts from now, so the next frame is on time again
+    clock.now += 1 / 64
+    assert scheduler.should_render()
+    assert scheduler.frames_skipped == 0
+
+
+def test_wait_when_late_does_not_sleep():
+    scheduler, clock = make_scheduler()
+    scheduler.should_render()
+    clock.now += 1 / 16
+    scheduler.wait()
+    assert clock.slept == []
+
+
+def test_reset_clears_the_backlog():
+    scheduler, clock = make_scheduler()
+    clock.now += 1.5 / 64
+    scheduler.advance()
+    clock.now += 5.0
+    scheduler.reset()
+    assert scheduler.alpha == 0.0
+    assert scheduler.ticks == 0
+    clock.now += 1 / 64
+    assert scheduler.advance() == 1
@@ -0,0 +1,106 @@
+"""
+Replays: encoding round trips, varint edge values, rejected inputs, and
+validation of what a replay may claim.
+"""
+
+import pytest
+from autoplay import play
+from simulation import Simulation
+from replay import (
+    Replay, REPLAY_MAGIC, REPLAY_VERSION, _HEADER, encode_replay, decode_replay,
+    simulate_replay, validate_replay
+)
+
+
+def test_header_is_21_bytes():
+    assert _HEADER.size == 21
+
+
+def test_round_trip():
+    replay = Replay(seed=2 ** 64 - 1, drop_ticks=[0, 5, 300, 301, 70000], score=4)
+    assert decode_replay(encode_replay(replay)) == replay
+
+
+def test_round_trip_without_drops():
+    replay = Replay(seed=7)
+    data = encode_replay(replay)
+    assert len(data) == _HEADER.size
+    assert decode_replay(data) == replay
+
+
+@pytest.mark.parametrize("delta, size", [(0, 1), (127, 1), (128, 2), (2 ** 32, 5)])
+def test_varint_edge_values(delta, size):
+    replay = Replay(seed=1, drop_ticks=[delta], score=0)
+    data = encode_replay(replay)
+    assert len(data) == _HEADER.size + size
+    assert decode_replay(data).drop_ticks == [delta]
+
+
+def test_varint_deltas_accumulate():
+    ticks = [127, 255, 255 + 2 ** 32]
+    assert decode_replay(encode_replay(Replay(seed=1, drop_ticks=ticks))).drop_ticks == ticks
+
+
+def test_descending_ticks_are_not_encoded():
+    with pytest.raises(ValueError):
+        encode_replay(Replay(seed=1, drop_ticks=[10, 5]))
+
+
+def test_bad_magic():
+    data = encode_replay(Replay(seed=1, drop_ticks=[3]))
+    with pytest.raises(ValueError, match="not a replay"):
+        decode_replay(b"XXXX" + data[len(REPLAY_MAGIC):])
+
+
+def test_bad_version():
+    data = bytearray(encode_replay(Replay(seed=1, drop_ticks=[3])))
+    data[len(REPLAY_MAGIC)] = REPLAY_VERSION + 1
+    with pytest.raises(ValueError, match="version"):
+        decode_replay(bytes(data))
+
+
+@pytest.mark.parametrize("length", [0, 4, _HEADER.size - 1])
+def test_truncated_header(length):
+    data = encode_replay(Replay(seed=1, drop_ticks=[3]))
+    with pytest.raises(ValueError, match="truncated"):
+        decode_replay(data[:length])
+
+
+def test_truncated_drops():
+    data = encode_replay(Replay(seed=1, drop_ticks=[1, 2 ** 20]))
+    # Cut inside the second drop's multi-byte varint
+    with pytest.raises(ValueError, match="truncated"):
+        decode_replay(data[:-1])
+    # Drop count promises more drops than the body holds
+    with pytest.raises(ValueError, match="truncated"):
+        decode_replay(data[:_HEADER.size + 1])
+
+
+@pytest.mark.parametrize("replay", [
+    Replay(seed=True, drop_ticks=[10], score=0),
+    Replay(seed=1, drop_ticks=[10], score=False),
+    Replay(seed=1, drop_ticks=[10, True], score=0),
+    Replay(seed=1, drop_ticks=[10, 10], score=0),
+    Replay(seed=1, drop_ticks=[500, 100], score=0),
+    Replay(seed=1, drop_ticks=[-1], score=0),
+])
+def test_invalid_replays_are_rejected(replay):
+    with pytest.raises(ValueError):
+        validate_replay(replay)
+
+
+def test_recorded_game_replays_to_its_score():
+    sim = play(seed=3, max_score=15)
+    replay = Replay.from_simulation(sim)
+    assert simulate_replay(replay).score == replay.score == 15
+
+
+def test_drops_after_the_losing_drop_are_invalid():
+    sim = Simulation(3)
+    while not sim.drop():
+        pass
+    replay = Replay.from_simulation(sim)
+    assert simulate_replay(replay).lost
+    replay.drop_ticks.append(sim.tick_count + 100)
+    with pytest.raises(ValueError, match="after the game was lost"):
+        simulate_replay(replay)
@@ -0,0 +1,98 @@
+"""
+GPU-ready texture blobs: a full mip chain of DXT1 (S3TC) blocks, written
+by build_assets.py and uploaded as-is with glCompressedTexImage2D.
+
+File layout (little-endian):
+    magic "CTEX", version (u8), format (u8), width (u16), height (u16),
+    level count (u8), then per mip level: width (u16), height (u16),
+    byte size (u32) and the compressed blocks, rows bottom-up as GL expects.
+"""
+
+import struct
+from typing import List, Tuple
+from OpenGL.GL import *
+from OpenGL.GL.EXT.texture_compression_s3tc import GL_COMPRESSED_RGB_S3TC_DXT1_EXT
+import gl_state
+
+
+BLOB_MAGIC = b"CTEX"
+BLOB_VERSION = 1
+BLOB_EXTENSION = ".ctex"
+FORMAT_DXT1 = 1
+S3TC_EXTENSION = "GL_EXT_texture_compression_s3tc"
+
+_HEADER = struct.Struct("<4sBBHHB")
+_LEVEL = struct.Struct("<HHI")
+
+MipLevel = Tuple[int, int, bytes]   # (width, height, compressed blocks)
+
+
+def write_blob(path: str, levels: List[MipLevel]) -> int:
+    """
+    Write a DXT1 mip chain, largest level first.
+
+    Returns:
+        int: Bytes written.
+    """
+    width, height, _ = levels[0]
+    parts = [_HEADER.pack(BLOB_MAGIC, BLOB_VERSION, FORMAT_DXT1, width, height, len(levels))]
+    for level_width, level_height, data in levels:
+        parts.append(_LEVEL.pack(level_width, level_height, len(data)))
+        parts.append(data)
+    blob = b"".join(parts)
+    with open(path, "wb") as f:
+        f.write(blob)
+    return len(blob)
+
+
+def read_blob(path: str) -> List[MipLevel]:
+    """
+    Read a blob's mip chain.
+
+    Raises:
+        ValueError: If the file is not a blob this version can read.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < _HEADER.size:
+        raise ValueError(f"{path}: truncated texture blob")
+    magic, version, fmt, _, _, count = _HEADER.unpack_from(data)
+    if magic != BLOB_MAGIC or version != BLOB_VERSION or fmt != FORMAT_DXT1:
+        raise ValueError(f"{path}: not a version {BLOB_VERSION} DXT1 texture blob")
+    levels = []
+    offset = _HEADER.size
+    for _ in range(count):
+        width, height, size = _LEVEL.unpack_from(data, offset)
+        offset += _LEVEL.size
+        if offset + size > len(data):
+            raise ValueError(f"{path}: truncated texture blob")
+        levels.append((width, height, data[offset:offset + size]))
+        offset += size
+    return levels
+
+
+def s3tc_supported() -> bool:
+    """True if the current GL context can sample DXT1 textures."""
+    if bool(glGetStringi):
+        # GL 3.0+; core profiles have no glGetString(GL_EXTENSIONS)
+        extensions = [glGetStringi(GL_EXTENSIONS, i)
+                      for i in range(glGetIntegerv(GL_NUM_EXTENSIONS))]
+    else:
+        extensions = (glGetString(GL_EXTENSIONS) or b"").split()
+    return S3TC_EXTENSION.encode() in extensions
+
+
+def upload_blob(levels: List[MipLevel]) -> int:
+    """Upload a DXT1 mip chain as a new trilinear-filtered, edge-clamped OpenGL texture."""
+    texture_id = glGenTextures(1)
+    gl_state.bind_texture(GL_TEXTURE_2D, texture_id)
+    for level, (width, height, data) in enumerate(levels):
+        # PyOpenGL derives the imageSize argument from data
+        glCompressedTexImage2D(GL_TEXTURE_2D, level, GL_COMPRESSED_RGB_S3TC_DXT1_EXT,
+                               width, height, 0, data)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAX_LEVEL, len(levels) - 1)
+    glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR_MIPMAP_LINEAR)
+    glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
+    return texture_id
@@ -0,0 +1,189 @@
+"""
+Cube texture lifetime: images are decoded once per process, packed into one
+atlas uploaded once per GL context, reused by every game played in that
+context, and deleted before the context goes away.
+
+The atlas is stacked from the blobs build_assets.py writes (mipmapped,
+DXT1) when every texture has one newer than its PNG and the driver supports
+S3TC; otherwise it is stacked from the decoded PNGs.
+"""
+
+import atexit
+import os
+from typing import Dict, List, Optional, Tuple
+import pygame
+from OpenGL.GL import *
+import gl_state
+from graphics import ATLAS_MAX_LEVEL, ATLAS_TILE_SIZE, upload_texture
+from texture_blob import BLOB_EXTENSION, MipLevel, read_blob, s3tc_supported, upload_blob
+from config import TEXTURE_DIR, ASSET_BUILD_DIR, textures, texture_atlas
+
+
+BYTES_PER_PIXEL = 3     # textures are uploaded as GL_RGB
+
+
+class TextureManager:
+    """
+    Owns the cube texture atlas for the current context: every texture
+    named in config.textures, stacked bottom to top as one tile each.
+
+    acquire() sets config.texture_atlas (and every config.textures entry)
+    to the atlas, uploading only when the context does not hold it yet;
+    release() deletes it and must be called before the GL context is torn
+    down (switching to a 2D screen or quitting).
+
+    Attributes:
+        directory (str): Folder holding <name>.png for each texture.
+        blob_directory (Optional[str]): Folder holding built <name>.ctex
+            blobs, or None to always load the PNGs.
+        uploads (int): Atlases uploaded to GL so far.
+        blob_uploads (int): How many of those were built from blobs.
+        reuses (int): acquire() calls served by an already resident atlas.
+    """
+
+    def __init__(self, directory: str = TEXTURE_DIR,
+                 blob_directory: Optional[str] = ASSET_BUILD_DIR):
+        self.directory = directory
+        self.blob_directory = blob_directory
+        self.uploads = 0
+        self.blob_uploads = 0
+        self.reuses = 0
+        self._images: Dict[str, Tuple[bytes, int, int]] = {}
+        self._blobs: Dict[str, Optional[List[MipLevel]]] = {}
+        self._tiles: List[str] = []     # texture names in the resident atlas, in tile order
+        self._atlas: Optional[Tuple[int, int]] = None     # (texture id, bytes)
+
+    def decode(self, name: str) -> Tuple[bytes, int, int]:
+        """Decoded RGB pixels of a texture image, read from disk on first use."""
+        image = self._images.get(name)
+        if image is None:
+            surface = pygame.image.load(f"{self.directory}/{name}.png")
+            width, height = surface.get_size()
+            image = self._images[name] = (pygame.image.tostring(surface, "RGB", True),
+                                          width, height)
+        return image
+
+    def blob(self, name: str) -> Optional[List[MipLevel]]:
+        """Built mip chain of a texture, or None if it has no up-to-date blob."""
+        if name not in self._blobs:
+            self._blobs[name] = None
+            if self.blob_directory is not None:
+                path = f"{self.blob_directory}/{name}{BLOB_EXTENSION}"
+                try:
+                    # A PNG edited since the last build wins over its blob
+                    if os.path.getmtime(path) >= os.path.getmtime(f"{self.directory}/{name}.png"):
+                        self._blobs[name] = read_blob(path)
+                except (OSError, ValueError):
+                    pass
+        return self._blobs[name]
+
+    def blob_atlas(self, names: List[str]) -> Optional[List[MipLevel]]:
+        """
+        Stack the blobs of names into atlas mip levels.
+
+        DXT1 stores 4x4 blocks row by row, so same-sized tiles stack by
+        concatenating their blocks. The chain stops after ATLAS_MAX_LEVEL,
+        the smallest level graphics.TILE_INSET keeps neighbouring tiles out
+        of, or earlier at a level whose tiles are less than one block row high.
+
+        Returns:
+            Optional[List[MipLevel]]: The atlas levels, or None if a texture
+                has no up-to-date blob or the tiles are not all
+                ATLAS_TILE_SIZE square.
+        """
+        chains = [self.blob(name) for name in names]
+        if not all(chains) or any(chain[0][:2] != (ATLAS_TILE_SIZE, ATLAS_TILE_SIZE)
+                                  for chain in chains):
+            return None
+        levels = []
+        for tiles in zip(*(chain[:ATLAS_MAX_LEVEL + 1] for chain in chains)):
+            width, height, _ = tiles[0]
+            if height % 4 or any((w, h) != (width, height) for w, h, _ in tiles):
+                break
+            levels.append((width, height * len(tiles), b"".join(data for _, _, data in tiles)))
+        return levels or None
+
+    def png_atlas(self, names: List[str]) -> Tuple[bytes, int, int]:
+        """
+        Stack the decoded PNGs of names into one RGB image.
+
+        Raises:
+            ValueError: If the images differ in size.
+        """
+        images = [self.decode(name) for name in names]
+        _, width, height = images[0]
+        if any((w, h) != (width, height) for _, w, h in images):
+            raise ValueError("cube textures must all have the same size to share an atlas")
+        return b"".join(data for data, _, _ in images), width, height * len(images)
+
+    def _upload(self, names: List[str]) -> Tuple[int, int]:
+        levels = None
+        if self.blob_directory is not None and s3tc_supported():
+            levels = self.blob_atlas(names)
+        if levels:
+            self.blob_uploads += 1
+            return upload_blob(levels), sum(len(data) for _, _, data in levels)
+        data, width, height = self.png_atlas(names)
+        return upload_texture(data, width, height), width * height * BYTES_PER_PIXEL
+
+    def _still_resident(self) -> bool:
+        # A context can also vanish without release() (e.g. a display
+        # re-init); its texture names are then simply no longer valid
+        return self._atlas is not None and bool(glIsTexture(self._atlas[0]))
+
+    def acquire(self) -> None:
+        """Make the atlas of every texture in config.textures resident in the current context."""
+        names = list(textures)
+        if self._still_resident() and self._tiles == names:
+            self.reuses += 1
+        else:
+            self._atlas = self._upload(names)
+            self._tiles = names
+            self.uploads += 1
+        texture_atlas["id"] = self._atlas[0]
+        for name in textures:
+            textures[name] = self._atlas[0]
+
+    def release(self) -> None:
+        """Delete the atlas from the current context and clear config.textures."""
+        if self._atlas and pygame.display.get_init() and pygame.display.get_surface():
+            gl_state.delete_textures([self._atlas[0]])
+        self._atlas = None
+        self._tiles = []
+        texture_atlas["id"] = None
+        for name in textures:
+            textures[name] = None
+
+    def resident_bytes(self) -> int:
+        """Texture memory held in GL, as uploaded (every mip level of a blob atlas)."""
+        return self._atlas[1] if self._atlas else 0
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for instrumentation."""
+        return {
+            "resident_textures": len(self._tiles),
+            "resident_bytes": self.resident_bytes(),
+            "decoded_images": len(self._images),
+            "uploads": self.uploads,
+            "blob_uploads": self.blob_uploads,
+            "reuses": self.reuses,
+        }
+
+
+_manager = TextureManager()
+
+
+def acquire_textures() -> None:
+    """Load the cube textures into the current GL context, reusing resident ones."""
+    _manager.acquire()
+
+
+@atexit.register
+def release_textures() -> None:
+    """Free the cube textures; call before the GL context is torn down."""
+    _manager.release()
+
+
+def texture_stats() -> Dict[str, int]:
+    """Resident texture count and memory, and upload/reuse counters."""
+    return _manager.stats()
@@ -1,10 +1,74 @@
 """
 2D UI rendering using pygame surfaces.
+
+Fonts and rendered strings are kept in bounded LRU caches so the menu
+screens do not re-parse the TTF or re-rasterise identical text each frame.
 """
 
 import pygame
+from functools import lru_cache
 from typing import Tuple
-from config import FONT_PATH
+from config import FONT_PATH, FONT_CACHE_SIZE, TEXT_CACHE_SIZE, IDLE_WAIT_MS
+
+
+@lru_cache(maxsize=FONT_CACHE_SIZE)
+def get_font(size: int) -> pygame.font.Font:
+    """
+    Return the UI font at a size, loading it from disk on first use.
+
+    Parameters:
+        size (int): Font size.
+    """
+    return pygame.font.Font(FONT_PATH, size)
+
+
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def render_text(text: str, size: int, color: Tuple[int, int, int]) -> pygame.Surface:
+    """
+    Render a string to a surface, reusing the surface for repeated requests.
+    The returned surface is shared and must not be modified.
+
+    Parameters:
+        text (str): Text string to render.
+        size (int): Font size.
+        color (Tuple[int, int, int]): RGB color.
+    """
+    return get_font(size).render(text, True, color)
+
+
+def cache_stats() -> dict:
+    """
+    Report hit/miss counters of the font and rendered-text caches.
+
+    Returns:
+        dict: {"fonts": {...}, "text": {...}} with hits, misses, maxsize and
+            currsize for each cache.
+    """
+    return {name: cache.cache_info()._asdict()
+            for name, cache in (("fonts", get_font), ("text", render_text))}
+
+
+def clear_caches() -> None:
+    """Drop every cached font and rendered string."""
+    render_text.cache_clear()
+    get_font.cache_clear()
+
+
+def wait_for_events(timeout_ms: int = IDLE_WAIT_MS) -> list:
+    """
+    Block until an event arrives (or the timeout passes), then drain the queue.
+    Lets static screens sleep instead of spinning.
+
+    Parameters:
+        timeout_ms (int): Longest time to block, in milliseconds.
+
+    Returns:
+        list: Pending events, empty if the timeout passed with none.
+    """
+    first = pygame.event.wait(timeout_ms)
+    if first.type == pygame.NOEVENT:
+        return []
+    return [first] + pygame.event.get()
 
 
 def draw_text(surface: pygame.Surface, text: str, box: Tuple[int, int, int, int],
@@ -20,8 +84,7 @@ def draw_text(surface: pygame.Surface, text: str, box: Tuple[int, int, int, int]
         color (Tuple[int, int, int]): RGB color.
         align (str): Horizontal alignment ('left', 'center', 'right').
     """
-    font = pygame.font.Font(FONT_PATH, size)
-    text_surface = font.render(text, True, color)
+    text_surface = render_text(text, size, tuple(color))
     w, _ = text_surface.get_size()
 
     x1, y1, x2, _ = box
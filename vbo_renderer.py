@@ -0,0 +1,120 @@
+"""
+Retained-mode cube rendering: a unit cube per atlas tile uploaded once to a
+vertex buffer and drawn per cube with a scale + translate.
+"""
+
+import ctypes
+import numpy as np
+from OpenGL.GL import *
+import gl_state
+from graphics import CUBE_FACES, CUBE_TEX_COORDS, ATLAS_TILES, atlas_v, begin_atlas
+from cube_stack import TEXTURE_INDEX
+
+
+CUBE_VERTEX_COUNT = 24
+_FLOAT_SIZE = 4
+VERTEX_STRIDE = 5 * _FLOAT_SIZE     # u, v, x, y, z
+
+_cube_buffer = None
+
+
+def build_unit_cube() -> np.ndarray:
+    """
+    Build the interleaved UV/position data of a unit cube.
+
+    Returns:
+        np.ndarray: (24, 5) float32 array of [u, v, x, y, z] rows, quad order.
+    """
+    rows = []
+    for face in CUBE_FACES:
+        for i in range(4):
+            rows.append(CUBE_TEX_COORDS[i] + face[i])
+    return np.array(rows, dtype=np.float32)
+
+
+def build_atlas_cubes() -> np.ndarray:
+    """
+    Build one unit cube per atlas tile, its v coordinates mapped into the tile.
+
+    Returns:
+        np.ndarray: (ATLAS_TILES * 24, 5) float32 array; tile t's cube starts
+            at row t * 24.
+    """
+    unit = build_unit_cube()
+    cubes = np.tile(unit, (ATLAS_TILES, 1, 1))
+    cubes[:, :, 1] = atlas_v(unit[:, 1], np.arange(ATLAS_TILES)[:, None])
+    return cubes.reshape(-1, 5)
+
+
+def init_cube_buffer() -> None:
+    """
+    Upload the per-tile unit cubes to the cube vertex buffer of the current
+    GL context, creating it unless it is still live. Must be called after
+    the context is created (once per game).
+    """
+    global _cube_buffer
+    data = build_atlas_cubes()
+    if _cube_buffer is None or not glIsBuffer(_cube_buffer):
+        _cube_buffer = glGenBuffers(1)
+    gl_state.bind_buffer(GL_ARRAY_BUFFER, _cube_buffer)
+    glBufferData(GL_ARRAY_BUFFER, data.nbytes, data, GL_STATIC_DRAW)
+
+
+def release_cube_buffer() -> None:
+    """Delete the cube vertex buffer; call before the GL context is torn down."""
+    global _cube_buffer
+    if _cube_buffer is not None:
+        gl_state.delete_buffers([_cube_buffer])
+    _cube_buffer = None
+
+
+def begin_textured_arrays(buffer) -> None:
+    """
+    Bind an interleaved [u, v, x, y, z] buffer and set up textured drawing
+    from the cube atlas. The state is left set for the next draw.
+
+    Parameters:
+        buffer (int): Vertex buffer object to source from.
+    """
+    gl_state.bind_buffer(GL_ARRAY_BUFFER, buffer)
+    gl_state.enable_client_state(GL_TEXTURE_COORD_ARRAY)
+    gl_state.enable_client_state(GL_VERTEX_ARRAY)
+    glTexCoordPointer(2, GL_FLOAT, VERTEX_STRIDE, ctypes.c_void_p(0))
+    glVertexPointer(3, GL_FLOAT, VERTEX_STRIDE, ctypes.c_void_p(2 * _FLOAT_SIZE))
+    begin_atlas()
+
+
+def draw_stack(stack, window=None) -> None:
+    """
+    Draw every cube of the stack from the shared unit-cube buffer.
+
+    Client state, pointers, the atlas bind and texture environment are set
+    once; each cube costs a push/translate/scale/draw/pop, its texture
+    chosen by drawing its tile's copy of the unit cube.
+
+    Parameters:
+        stack (List[Cube]): Cubes to draw, bottom to top.
+        window (Optional[Tuple[int, int]]): Half-open index range to draw;
+            the whole stack when None.
+    """
+    lo, hi = window if window is not None else (0, len(stack))
+    if lo >= hi:
+        return
+    if _cube_buffer is None:
+        init_cube_buffer()
+
+    begin_textured_arrays(_cube_buffer)
+
+    for i in range(lo, hi):
+        cube = stack[i]
+        glPushMatrix()
+        glTranslatef(*cube.position)
+        rx, ry, rz = cube.rotation
+        if rx or ry or rz:
+            glRotatef(rx, 1, 0, 0)
+            glRotatef(ry, 0, 1, 0)
+            glRotatef(rz, 0, 0, 1)
+        glScalef(*cube.size)
+        glDrawArrays(GL_QUADS, TEXTURE_INDEX[cube.texture_id] * CUBE_VERTEX_COUNT,
+                     CUBE_VERTEX_COUNT)
+        glPopMatrix()
@@ -0,0 +1,165 @@
+"""
+Bulk replay verifier: re-simulates claimed games across a process pool and
+checks each final score against the claim.
+
+Inputs are replay files (.csrp), directories of them, or JSON-lines files
+with one record per line: {"seed": int, "drops": [tick, ...], "score": int}
+("-" reads JSON lines from stdin).
+
+A record that cannot be read or decoded, or that fails validate_replay
+(ticks not strictly ascending, or beyond the configured bounds), counts as
+a failed record; the run carries on with the rest.
+
+Usage:
+    python verify_replays.py replays/ [claims.jsonl ...] [--workers N]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, List, Tuple, Union
+from replay import Replay, REPLAY_EXTENSION, load_replay, simulate_replay
+
+
+# A replay, or why the input holding it could not be read
+Record = Union[Replay, str]
+
+
+def read_records(sources: Iterable[str]) -> Iterator[Tuple[str, Record]]:
+    """
+    Yield (name, record) for every game record in the given sources. Inputs
+    that cannot be read or decoded are yielded as an error message instead
+    of a Replay, so one bad file or line does not stop the run.
+
+    Parameters:
+        sources (Iterable[str]): Replay files, directories of replay files,
+            JSON-lines files, or "-" for JSON lines on stdin.
+    """
+    for source in sources:
+        if source == "-":
+            yield from _read_json_lines(sys.stdin, "stdin")
+        elif os.path.isdir(source):
+            for name in sorted(os.listdir(source)):
+                if name.endswith(REPLAY_EXTENSION):
+                    path = os.path.join(source, name)
+                    yield path, _load_replay_file(path)
+        elif source.endswith(REPLAY_EXTENSION):
+            yield source, _load_replay_file(source)
+        else:
+            try:
+                with open(source, "r", errors="replace") as f:
+                    yield from _read_json_lines(f, source)
+            except OSError as exc:
+                yield source, f"unreadable: {exc}"
+
+
+def _load_replay_file(path: str) -> Record:
+    try:
+        return load_replay(path)
+    except (OSError, ValueError) as exc:
+        return f"unreadable replay: {exc}"
+
+
+def _read_json_lines(lines: Iterable[str], source: str) -> Iterator[Tuple[str, Record]]:
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            replay = Replay(seed=record["seed"], drop_ticks=list(record["drops"]),
+                            score=record["score"])
+        except (ValueError, KeyError, TypeError) as exc:
+            replay = f"bad record: {exc!r}"
+        yield f"{source}:{number}", replay
+
+
+def verify_chunk(chunk: List[Tuple[str, Record]]) -> List[Tuple[str, str]]:
+    """
+    Re-simulate a chunk of records (runs in a worker process).
+
+    Returns:
+        List[Tuple[str, str]]: (name, reason) of every record that could
+            not be read, fails validation, or whose claim does not hold.
+    """
+    failures = []
+    for name, replay in chunk:
+        if isinstance(replay, str):
+            failures.append((name, replay))
+            continue
+        try:
+            actual = simulate_replay(replay).score
+        except ValueError as exc:
+            failures.append((name, f"invalid replay: {exc}"))
+            continue
+        if actual != replay.score:
+            failures.append((name, f"claimed {replay.score}, replays to {actual}"))
+    return failures
+
+
+def chunked(records: Iterable, size: int) -> Iterator[list]:
+    """Group an iterable into lists of at most size items."""
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def verify_all(records: Iterable[Tuple[str, Record]], workers: int,
+               chunk_size: int = 256) -> Tuple[int, List[Tuple[str, str]]]:
+    """
+    Verify every record, spread over worker processes in chunks so the
+    per-task overhead stays small next to the simulation work.
+
+    Returns:
+        Tuple[int, List[Tuple[str, str]]]: (records checked, failures).
+    """
+    checked = 0
+    failures = []
+    if workers <= 1:
+        for chunk in chunked(records, chunk_size):
+            checked += len(chunk)
+            failures.extend(verify_chunk(chunk))
+        return checked, failures
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = []
+        for chunk in chunked(records, chunk_size):
+            checked += len(chunk)
+            pending.append(pool.submit(verify_chunk, chunk))
+            # Bound the queue so huge inputs are streamed, not all held at once
+            if len(pending) >= workers * 4:
+                failures.extend(pending.pop(0).result())
+        for future in pending:
+            failures.extend(future.result())
+    return checked, failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Re-simulate claimed games and check their scores.")
+    parser.add_argument("sources", nargs="+",
+                        help="replay files or directories, JSON-lines files, or - for stdin")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=256)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    checked, failures = verify_all(read_records(args.sources), args.workers, args.chunk_size)
+    elapsed = time.perf_counter() - start
+
+    for name, reason in failures:
+        print(f"FAILED {name}: {reason}")
+    rate = checked / elapsed if elapsed > 0 else 0.0
+    print(f"{checked} replays checked, {len(failures)} failed, "
+          f"{rate:.0f} replays/s with {args.workers} worker(s)")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()